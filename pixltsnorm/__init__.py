@@ -8,7 +8,7 @@ normalization, bridging, and harmonization across multiple sensors.
 Submodules:
   - harmonize            : Chain bridging logic (two-pass) for arrays.
   - dataframe_harmonize : Tools for DataFrame-based bridging.
-  - models               : Contains `fit_linear` and `fit_seasonal` routines.
+  - models               : Contains `fit_linear`, `fit_linear_filtered` and `fit_seasonal` routines.
   - utils                : Utility functions for outlier filtering, time series extraction.
   - earth_engine         : (Subpackage) Earth Engine–specific routines (e.g., NDVI creation).
 
@@ -16,12 +16,57 @@ Exposed API:
   - Harmonizer
   - DataFrameHarmonizer
   - fit_linear
+  - fit_linear_filtered
   - fit_seasonal
   - unify_and_extract_timeseries
   - filter_outliers
+  - filter_outliers_into
+  - outlier_mask
 """
 
-from .harmonize import Harmonizer
-from .dataframe_harmonize import DataFrameHarmonizer
-from .models import fit_linear, fit_seasonal
-from .utils import unify_and_extract_timeseries, filter_outliers
+from importlib import import_module
+
+# public name -> submodule; resolved on first access (PEP 562), so that e.g.
+# ``from pixltsnorm import Harmonizer`` does not pay for importing pandas, which
+# only the DataFrame tools need
+_EXPORTS = {
+    "Harmonizer": ".harmonize",
+    "DataFrameHarmonizer": ".dataframe_harmonize",
+    "fit_linear": ".models",
+    "fit_linear_filtered": ".models",
+    "fit_seasonal": ".models",
+    "unify_and_extract_timeseries": ".utils",
+    "filter_outliers": ".utils",
+    "filter_outliers_into": ".utils",
+    "outlier_mask": ".utils",
+}
+# submodules that were bound as attributes by the eager imports, kept reachable
+# as ``pixltsnorm.<name>`` (imported on first access as well)
+_SUBMODULES = {"harmonize", "dataframe_harmonize", "models", "utils"}
+
+__all__ = [
+    "Harmonizer",
+    "DataFrameHarmonizer",
+    "fit_linear",
+    "fit_linear_filtered",
+    "fit_seasonal",
+    "unify_and_extract_timeseries",
+    "filter_outliers",
+    "filter_outliers_into",
+    "outlier_mask",
+]
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    if name in _SUBMODULES:
+        # importing a submodule binds it on the package itself
+        return import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | _SUBMODULES)
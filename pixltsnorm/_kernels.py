@@ -0,0 +1,366 @@
+"""
+_kernels.py
+===========
+
+Internal numerical kernels shared by the harmonizers.
+
+The bridging regressions only need five sufficient statistics of the kept
+(inlier) pairs — ``n``, ``Σa``, ``Σb``, ``Σa²`` and ``Σab`` — so instead of
+materializing filtered copies of potentially very large arrays, these kernels
+stream over the data in fixed-size chunks and accumulate the sums directly.
+The sums are taken about reference values ``(ra, rb)`` (kept data values), which
+removes the catastrophic cancellation of ``n·Σa² - (Σa)²`` for data with a large
+offset relative to its spread; the statistics are therefore carried as
+``(n, sa, sb, saa, sab, ra, rb)``.
+
+**Functions**:
+
+1. **`sufficient_stats(a, b, threshold)`**
+   - Accumulates ``(n, sa, sb, saa, sab, ra, rb)`` over the last axis, keeping only the
+     pairs that satisfy :math:`|a - b| \\leq threshold` (NaNs never do), optionally
+     splitting the axis across threads (``n_jobs``).
+
+2. **`pooled_stats(a, b, threshold)`**
+   - Same as above, but pooled over every element (for global bridging of 1D or
+     2D blocks).
+
+3. **`linear_from_stats(n, sa, sb, saa, sab, ra, rb)`**
+   - Closes the ordinary least squares fit :math:`b = slope \\cdot a + intercept`
+     from the accumulated sums.
+
+4. **`fit_filtered(a, b, threshold)`**
+   - Outlier filtering fused with the regression: one streaming pass returning
+     ``(slope, intercept, n_kept)``.
+
+5. **`compose_chain(coefs, intercepts)`**
+   - Composes a chain of pairwise affine bridgings outward from the target, one
+     step per adjacency, vectorized over pixels/rows.
+
+6. **`additive_seasonal(values, period)`**
+   - Seasonal component of a classical additive decomposition (centered moving
+     average trend with extrapolated ends, per-phase means of the detrended
+     series), matching statsmodels' ``seasonal_decompose(..., model="additive",
+     extrapolate_trend="freq")``.
+
+These are not part of the public API.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+# variance of the independent variable below this fraction of its (shifted) mean
+# square is rounding noise and treated as zero; a constant series gives exactly 0
+# since the sums are taken about one of its values
+ZERO_VARIANCE_RTOL = 16 * np.finfo(np.float64).eps
+
+# number of elements processed per chunk in `sufficient_stats`; small enough that
+# the float64 working copies of a chunk stay cache-resident, so float32 inputs are
+# only streamed from memory once at their native width
+CHUNK_SIZE = 1 << 16
+
+
+def _shift_stats(stats, ra, rb):
+    # re-express sums taken about (ra0, rb0) about the references (ra, rb)
+    n, sa, sb, saa, sab, ra0, rb0 = stats
+    da = ra0 - ra
+    db = rb0 - rb
+    return (
+        n,
+        sa + n * da,
+        sb + n * db,
+        saa + da * (2 * sa + n * da),
+        sab + da * sb + db * sa + n * da * db,
+        ra,
+        rb,
+    )
+
+
+def _merge_stats(s, t):
+    # element-wise sum of two sets of statistics, about the references of `s`
+    # wherever it holds data (its references are arbitrary where n == 0)
+    has_data = s[0] > 0
+    ra = np.where(has_data, s[5], t[5])
+    rb = np.where(has_data, s[6], t[6])
+    s = _shift_stats(s, ra, rb)
+    t = _shift_stats(t, ra, rb)
+    return tuple(s[i] + t[i] for i in range(5)) + (ra, rb)
+
+
+def _accumulate(a, b, thr, start, stop, step):
+    # sums over a[..., start:stop], chunk by chunk
+    lead = a.shape[:-1]
+    zeros = np.zeros(lead, dtype=np.float64)
+    stats = (np.zeros(lead, dtype=np.int64),) + (zeros,) * 6
+
+    for lo in range(start, stop, step):
+        hi = min(lo + step, stop)
+        a_k = a[..., lo:hi].astype(np.float64)
+        b_k = b[..., lo:hi].astype(np.float64)
+
+        keep = np.abs(a_k - b_k) <= thr
+        n = keep.sum(axis=-1)
+        # the first kept pair of each row is the chunk's reference (0 if none)
+        first = keep.argmax(axis=-1)[..., np.newaxis]
+        ra = np.where(n > 0, np.take_along_axis(a_k, first, -1)[..., 0], 0.0)
+        rb = np.where(n > 0, np.take_along_axis(b_k, first, -1)[..., 0], 0.0)
+        a_k -= ra[..., np.newaxis]
+        b_k -= rb[..., np.newaxis]
+        # zero out the rejected pairs so they drop out of every sum
+        np.copyto(a_k, 0.0, where=~keep)
+        np.copyto(b_k, 0.0, where=~keep)
+
+        chunk = (
+            n,
+            a_k.sum(axis=-1),
+            b_k.sum(axis=-1),
+            np.einsum("...i,...i->...", a_k, a_k),
+            np.einsum("...i,...i->...", a_k, b_k),
+            ra,
+            rb,
+        )
+        stats = _merge_stats(stats, chunk)
+
+    return stats
+
+
+def sufficient_stats(a, b, threshold, chunk_size=CHUNK_SIZE, n_jobs=None):
+    """
+    Accumulate the OLS sufficient statistics of the inlier pairs of ``a`` and ``b``.
+
+    The reduction runs over the last axis, so 1D inputs give scalars and a 2D
+    ``(rows, cols)`` input gives one set of sums per row. Data are read in chunks of
+    roughly ``chunk_size`` elements and cast to float64 per chunk, so memory use stays
+    bounded regardless of the input size.
+
+    With ``n_jobs > 1`` the last axis is split into contiguous blocks of chunks that
+    are reduced in a thread pool (NumPy releases the GIL inside its kernels) and the
+    partial sums are added up; results only differ by floating point rounding.
+
+    :param a: Values of the first (independent) sensor.
+    :type a: numpy.ndarray
+    :param b: Values of the second (dependent) sensor, same shape as ``a``.
+    :type b: numpy.ndarray
+    :param threshold: Pairs with ``abs(a - b) > threshold`` (or a NaN on either side)
+        are ignored. A scalar, or an array broadcastable to ``a.shape[:-1]``.
+    :type threshold: float or numpy.ndarray
+    :param chunk_size: Approximate number of elements processed per chunk.
+    :type chunk_size: int
+    :param n_jobs: Number of threads; None or 1 runs serially, -1 uses all CPUs.
+    :type n_jobs: int or None
+    :return: ``(n, sa, sb, saa, sab, ra, rb)`` with shape ``a.shape[:-1]``, where
+        the sums are of ``a - ra`` and ``b - rb`` for the reference values
+        ``ra``/``rb`` (a kept pair, or 0 when ``n == 0``).
+    :rtype: tuple[numpy.ndarray, ...]
+    :raises ValueError: If ``a`` and ``b`` do not have the same shape.
+    """
+    a = np.asarray(a)
+    b = np.asarray(b)
+    if a.shape != b.shape:
+        raise ValueError(f"shape mismatch: {a.shape} vs {b.shape}")
+
+    thr = np.asarray(threshold, dtype=np.float64)[..., np.newaxis]
+    size = a.shape[-1]
+    step = max(1, chunk_size // max(1, int(np.prod(a.shape[:-1]))))
+
+    if n_jobs == -1:
+        n_jobs = os.cpu_count() or 1
+    n_chunks = -(-size // step)
+    n_jobs = min(n_jobs or 1, n_chunks)
+    if n_jobs <= 1:
+        return _accumulate(a, b, thr, 0, size, step)
+
+    # contiguous, chunk-aligned block of the last axis per thread
+    bounds = [(-(-n_chunks * j // n_jobs)) * step for j in range(n_jobs + 1)]
+    bounds[-1] = size
+    with ThreadPoolExecutor(max_workers=n_jobs) as pool:
+        partials = list(
+            pool.map(
+                lambda j: _accumulate(a, b, thr, bounds[j], bounds[j + 1], step),
+                range(n_jobs),
+            )
+        )
+    stats = partials[0]
+    for p in partials[1:]:
+        stats = _merge_stats(stats, p)
+    return stats
+
+
+def pooled_stats(a, b, threshold, chunk_size=CHUNK_SIZE, n_jobs=None):
+    """
+    Accumulate the OLS sufficient statistics over *all* elements of ``a`` and ``b``.
+
+    Like `sufficient_stats`, but pooled into scalars. When both inputs are
+    contiguous in the same memory order (e.g. C-ordered arrays, or the F-ordered
+    blocks returned by ``DataFrame.to_numpy``) they are raveled in that order,
+    which is a free view and reduces as one long 1D stream; other layouts are
+    reduced row by row and the rows summed, so no copy is made either way.
+
+    :return: ``(n, sa, sb, saa, sab, ra, rb)`` as scalars.
+    :rtype: tuple
+    """
+    a = np.atleast_1d(np.asarray(a))
+    b = np.atleast_1d(np.asarray(b))
+    if a.shape != b.shape:
+        raise ValueError(f"shape mismatch: {a.shape} vs {b.shape}")
+
+    for order, flag in (("C", "C_CONTIGUOUS"), ("F", "F_CONTIGUOUS")):
+        if a.flags[flag] and b.flags[flag]:
+            # same order for both => elements stay paired
+            a, b = a.ravel(order=order), b.ravel(order=order)
+            break
+
+    stats = sufficient_stats(a, b, threshold, chunk_size=chunk_size, n_jobs=n_jobs)
+    if stats[0].ndim == 0:
+        return stats
+    # pool the rows about the references of the first row holding data
+    first = np.argmax(stats[0] > 0)
+    stats = _shift_stats(stats, stats[5][first], stats[6][first])
+    return tuple(s.sum() for s in stats[:5]) + stats[5:]
+
+
+def linear_from_stats(n, sa, sb, saa, sab, ra=0.0, rb=0.0):
+    """
+    Compute the OLS slope and intercept from accumulated sufficient statistics.
+
+    With the sums taken about ``(ra, rb)``, uses
+    ``slope = (n*Σab - Σa*Σb) / (n*Σa² - (Σa)²)`` and
+    ``intercept = rb + (Σb - slope*Σa) / n - slope*ra``. A constant ``a`` (variance
+    at rounding level relative to the mean of ``(a - ra)²``) gives a slope of 0 and
+    the mean of ``b`` as intercept; ``n == 0`` gives NaN for both.
+    Works element-wise on array inputs.
+
+    :return: ``(slope, intercept)``, scalars or arrays matching the inputs.
+    :rtype: tuple
+    """
+    n = np.asarray(n, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        denom = n * saa - sa * sa
+        slope = np.where(
+            denom > ZERO_VARIANCE_RTOL * n * saa, (n * sab - sa * sb) / denom, 0.0
+        )
+        slope = np.where(n > 0, slope, np.nan)
+        intercept = rb + (sb - slope * sa) / n - slope * ra
+    if slope.ndim == 0:
+        return float(slope), float(intercept)
+    return slope, intercept
+
+
+def fit_filtered(a, b, threshold, n_jobs=None):
+    """
+    Fit ``b = slope * a + intercept`` on the pairs with ``abs(a - b) <= threshold``.
+
+    Threshold filtering and the OLS accumulation happen in the same streaming pass
+    (`pooled_stats`), so neither a mask-filtered copy of ``a``/``b`` nor any other
+    full-length temporary is materialized.
+
+    :return: ``(slope, intercept, n_kept)``; slope and intercept are NaN when no pair
+        is kept.
+    :rtype: tuple[float, float, int]
+    """
+    stats = pooled_stats(a, b, threshold, n_jobs=n_jobs)
+    slope, intercept = linear_from_stats(*stats)
+    return slope, intercept, int(stats[0])
+
+
+def compose_chain(coefs, intercepts):
+    """
+    Compose a chain of affine bridgings outward from the target sensor.
+
+    Given the bridging coefficients ``(a_k, b_k)`` ordered from the target outward,
+    returns the composed transforms of the recurrence ``S_k = a_k * S_{k-1}`` and
+    ``I_k = a_k * I_{k-1} + b_k`` (with ``S_{-1} = 1, I_{-1} = 0``). The recurrence
+    is stepped once per adjacency (a handful of sensors) while each step is
+    vectorized over any trailing per-row/per-pixel axes, so memory stays O(m * P)
+    and no division is involved: zero or NaN coefficients behave exactly as in the
+    scalar loop.
+
+    :param coefs: Bridging slopes, shape ``(m,)`` or ``(m, ...)`` for per-row slopes.
+    :type coefs: array-like
+    :param intercepts: Bridging intercepts, same shape as ``coefs``.
+    :type intercepts: array-like
+    :return: ``(slopes, intercepts)`` of the composed transforms, same shape as the
+        inputs.
+    :rtype: tuple[numpy.ndarray, numpy.ndarray]
+    """
+    a = np.asarray(coefs, dtype=np.float64)
+    b = np.asarray(intercepts, dtype=np.float64)
+
+    slopes = np.empty_like(a)
+    inters = np.empty_like(b)
+    if a.shape[0] == 0:
+        return slopes, inters
+
+    slopes[0] = a[0]
+    inters[0] = b[0]
+    for k in range(1, a.shape[0]):
+        slopes[k] = a[k] * slopes[k - 1]
+        inters[k] = a[k] * inters[k - 1] + b[k]
+    return slopes, inters
+
+
+def _extrapolated_end(t, y, at):
+    # least-squares line through (t, y), evaluated at `at`; lstsq (not a closed
+    # form) so that the rank-deficient single-point case matches statsmodels
+    A = np.stack([t, np.ones_like(t)], axis=1).astype(np.float64)
+    k, c = np.linalg.lstsq(A, y, rcond=-1)[0]
+    return at * k + c
+
+
+def additive_seasonal(values, period):
+    """
+    Seasonal component of the additive decomposition of a 1D series.
+
+    The trend is a centered moving average of length ``period`` (a 2x``period``
+    average with half weights at both ends for even periods), whose undefined ends
+    are linearly extrapolated from the ``period`` closest defined points. The
+    seasonal component is the per-phase mean of ``values - trend``, centered to zero
+    mean and tiled over the series.
+
+    :param values: The series, without missing values.
+    :type values: array-like
+    :param period: Number of observations per cycle.
+    :type period: int
+    :return: The seasonal component, same length as `values`.
+    :rtype: numpy.ndarray
+    :raises ValueError: If `values` contains NaN/inf or spans fewer than two
+        complete cycles.
+    """
+    x = np.asarray(values, dtype=np.float64).ravel()
+    nobs = x.size
+    if not np.all(np.isfinite(x)):
+        raise ValueError("This function does not handle missing values")
+    if nobs < 2 * period:
+        raise ValueError(
+            f"x must have 2 complete cycles requires {2 * period} "
+            f"observations. x only has {nobs} observation(s)"
+        )
+
+    if period % 2 == 0:
+        filt = np.r_[0.5, np.ones(period - 1), 0.5] / period
+    else:
+        filt = np.full(period, 1.0 / period)
+    half = (filt.size - 1) // 2
+
+    trend = np.empty(nobs)
+    trend[half : nobs - half] = np.convolve(x, filt, mode="valid")
+
+    # extrapolate both ends from the `period` closest defined points
+    front, back = half, nobs - 1 - half
+    t = np.arange(nobs, dtype=np.float64)
+    if front > 0:
+        stop = min(front + period, back)
+        trend[:front] = _extrapolated_end(t[front:stop], trend[front:stop], t[:front])
+        start = max(front, back - period)
+        trend[back + 1 :] = _extrapolated_end(
+            t[start:back], trend[start:back], t[back + 1 :]
+        )
+
+    # per-phase means of the detrended series (padding the last cycle with NaN)
+    n_cycles = -(-nobs // period)
+    detrended = np.full(n_cycles * period, np.nan)
+    np.subtract(x, trend, out=detrended[:nobs])
+    averages = np.nanmean(detrended.reshape(n_cycles, period), axis=0)
+    averages -= averages.mean()
+    return np.tile(averages, n_cycles)[:nobs]
@@ -28,8 +28,11 @@ transform (df[i]→target).
 
 
 import numpy as np
+import pandas as pd
 
+from ._kernels import compose_chain, linear_from_stats, pooled_stats
 from .harmonize import Harmonizer
+from .utils import filter_outliers_into
 
 
 class DataFrameHarmonizer:
@@ -59,7 +62,13 @@ class DataFrameHarmonizer:
     """
 
     def __init__(
-        self, method="linear", period=None, outlier_threshold=0.2, approach="global"
+        self,
+        method="linear",
+        period=None,
+        outlier_threshold=0.2,
+        approach="global",
+        dtype=np.float32,
+        n_jobs=None,
     ):
         """
         Args:
@@ -67,11 +76,21 @@ class DataFrameHarmonizer:
             period (int or None): if using 'seasonal_decompose' (only valid for 2 DF)
             outlier_threshold (float): threshold for outlier filter
             approach (str): 'global' or 'local'
+            dtype (numpy dtype or None): dtype the data columns are extracted as for
+                global bridging. float32 (default) halves the memory traffic and is
+                ample for NDVI-like data; the regression sums are always accumulated
+                in float64. None keeps the stored dtype (e.g. int16 scaled data, in
+                which case outlier_threshold is in the same scaled units).
+            n_jobs (int or None): threads used to accumulate the global linear
+                regression sums of each adjacency (None or 1 => serial, -1 => all
+                CPUs); worthwhile for large scenes.
         """
         self.method = method
         self.period = period
         self.outlier_threshold = outlier_threshold
         self.approach = approach  # 'global' or 'local'
+        self.dtype = dtype
+        self.n_jobs = n_jobs
 
         self._skip_cols = {"lon", "lat"}
         self.transforms_ = None
@@ -137,18 +156,28 @@ class DataFrameHarmonizer:
         self.pairwise_left_.clear()
         self.pairwise_right_.clear()
 
-        # LEFT pass
+        # every adjacency (k, k+1) is bridged exactly once by one of the passes,
+        # so compute them all up front
+        bridges = self._bridge_adjacencies(dfs)
+
+        # LEFT pass: adjacencies (i-1, i) from the target down to 0
         for i in range(target_index, 0, -1):
-            bridging_res = self._bridge_pair(dfs[i - 1], dfs[i])
-            self.pairwise_left_.append(((i - 1, i), bridging_res))
             # bridging_res => { "coef", "intercept" }, shape=() or shape=[n_rows]
-            self._compose_into(i - 1, i, bridging_res)
+            self.pairwise_left_.append(((i - 1, i), bridges[i - 1]))
 
-        # RIGHT pass
+        # RIGHT pass: adjacencies (i, i+1) from the target up to n-1
         for i in range(target_index, n - 1):
-            bridging_res = self._bridge_pair(dfs[i], dfs[i + 1])
-            self.pairwise_right_.append(((i, i + 1), bridging_res))
-            self._compose_into(i + 1, i, bridging_res, reverse=False)
+            self.pairwise_right_.append(((i, i + 1), bridges[i]))
+
+        # compose each side outward from the target, one step per adjacency
+        for (pair, _), transform in zip(
+            self.pairwise_left_, self._compose_chain(self.pairwise_left_)
+        ):
+            self.transforms_[pair[0]] = transform
+        for (pair, _), transform in zip(
+            self.pairwise_right_, self._compose_chain(self.pairwise_right_)
+        ):
+            self.transforms_[pair[1]] = transform
 
         return self
 
@@ -175,7 +204,43 @@ class DataFrameHarmonizer:
     # ---------------------------
     # Internal bridging logic
     # ---------------------------
-    def _bridge_pair(self, dfA, dfB):
+    def _bridge_adjacencies(self, dfs):
+        """
+        Bridge every adjacent pair ``(dfs[k], dfs[k+1])`` of the chain.
+
+        For the global linear case, the sufficient statistics of all adjacencies are
+        accumulated first and the regressions are then closed together in a single
+        vectorized call. Other configurations bridge each pair via `_bridge_pair`.
+
+        :param dfs: The chain of DataFrames being harmonized.
+        :type dfs: list[pandas.DataFrame]
+        :return: A list of ``n - 1`` bridging results, where entry ``k`` maps
+            ``dfs[k]`` onto ``dfs[k+1]``.
+        :rtype: list[dict]
+        """
+        pairs = range(len(dfs) - 1)
+
+        # resolve each frame's data columns once (inner frames belong to two
+        # adjacencies) and each adjacency's sorted overlap once; this also validates
+        # the whole chain before any data is read
+        data_cols = [self._data_columns(df) for df in dfs]
+        overlaps = [
+            self._intersect_columns(data_cols[k], data_cols[k + 1]) for k in pairs
+        ]
+
+        if self.approach != "global" or self.method != "linear":
+            return [self._bridge_pair(dfs[k], dfs[k + 1], overlaps[k]) for k in pairs]
+
+        stats = np.array(
+            [self._global_stats(dfs[k], dfs[k + 1], overlaps[k]) for k in pairs]
+        )
+        slopes, intercepts = linear_from_stats(*stats.T)
+        return [
+            {"coef": float(slope), "intercept": float(intercept)}
+            for slope, intercept in zip(slopes, intercepts)
+        ]
+
+    def _bridge_pair(self, dfA, dfB, overlap):
         """
         Bridge two dataframes based on the specified approach.
 
@@ -188,38 +253,45 @@ class DataFrameHarmonizer:
         :type dfA: pandas.DataFrame
         :param dfB: The second dataframe to be bridged.
         :type dfB: pandas.DataFrame
+        :param overlap: Overlapping data columns of the pair, as resolved by
+            `_bridge_adjacencies`.
+        :type overlap: pandas.Index
         :return: The resulting dataframe after applying the bridging method.
         :rtype: pandas.DataFrame
         """
         if self.approach == "global":
-            return self._bridge_global(dfA, dfB)
+            return self._bridge_global(dfA, dfB, overlap)
         else:
-            return self._bridge_local(dfA, dfB)
+            return self._bridge_local(dfA, dfB, overlap)
 
-    def _bridge_global(self, dfA, dfB):
+    def _bridge_global(self, dfA, dfB, overlap):
         """
         Performs global harmonization between two dataframes by calculating the overlap, cleaning
         the data, and applying a predefined harmonization method. This operation ensures alignment
         of distributions and removes discrepancies based on a specified method and parameters.
+        Only used for the seasonal method; global linear adjacencies are closed together
+        in `_bridge_adjacencies`.
 
         :param dfA: First DataFrame containing data to be harmonized.
         :type dfA: pandas.DataFrame
         :param dfB: Second DataFrame containing data to be harmonized.
         :type dfB: pandas.DataFrame
+        :param overlap: Overlapping data columns of the pair, as resolved by
+            `_bridge_adjacencies`.
+        :type overlap: pandas.Index
 
         :return: A dictionary containing the calculated coefficients for slope and intercept
                  after harmonization.
         :rtype: dict
 
-        :raises ValueError: If there is no valid data left after removing NaN values during
-                            the global adjacency validation step.
+        :raises ValueError: If there is no valid data left after removing NaN values
+                            during the global adjacency validation step.
         """
-        overlap = self._overlap_columns(dfA, dfB)
         arrA, arrB = self._flatten_and_clean(dfA[overlap], dfB[overlap])
         if len(arrA) == 0:
             raise ValueError("No valid data after removing NaNs (global adjacency).")
 
-        # If n=2 or method='linear' => no problem
+        # seasonal_decompose (n=2) => defer to the array Harmonizer
         small_harm = Harmonizer(
             method=self.method,
             period=self.period,
@@ -229,7 +301,38 @@ class DataFrameHarmonizer:
         slope, intercept = small_harm.transforms_[0]
         return {"coef": slope, "intercept": intercept}
 
-    def _bridge_local(self, dfA, dfB):
+    def _global_stats(self, dfA, dfB, overlap):
+        """
+        Accumulates the regression sufficient statistics of a global adjacency in a
+        single streaming pass over the overlapping columns. NaNs and outliers
+        (``abs(A - B) > outlier_threshold``) drop out of the same mask, so no filtered
+        copies of the data are ever materialized.
+
+        :param dfA: First DataFrame of the adjacency (independent variable).
+        :type dfA: pandas.DataFrame
+        :param dfB: Second DataFrame of the adjacency (dependent variable).
+        :type dfB: pandas.DataFrame
+        :param overlap: Overlapping data columns of the pair, as resolved by
+            `_bridge_adjacencies`.
+        :type overlap: pandas.Index
+        :return: The statistics ``(n, sa, sb, saa, sab, ra, rb)`` of all kept pairs
+            (see `pooled_stats`).
+        :rtype: tuple
+        :raises ValueError: If no pair survives the NaN and outlier filtering.
+        """
+        stats = pooled_stats(
+            self._to_numpy(dfA[overlap], dtype=self.dtype),
+            self._to_numpy(dfB[overlap], dtype=self.dtype),
+            self.outlier_threshold,
+            n_jobs=self.n_jobs,
+        )
+        if stats[0] == 0:
+            raise ValueError(
+                "No valid data after removing NaNs and outliers (global adjacency)."
+            )
+        return stats
+
+    def _bridge_local(self, dfA, dfB, overlap):
         """
         Executes a local bridging operation between two dataframes (dfA and dfB) by calculating
         linear regression coefficients (slopes and intercepts) for each row based on overlapping
@@ -240,12 +343,14 @@ class DataFrameHarmonizer:
         :type dfA: pandas.DataFrame
         :param dfB: Second dataframe used in the bridging operation.
         :type dfB: pandas.DataFrame
+        :param overlap: Overlapping data columns of the pair, as resolved by
+            `_bridge_adjacencies`.
+        :type overlap: pandas.Index
         :return: Dictionary with two keys: "coef", containing an array of slopes calculated for
                  each row, and "intercept", containing an array of intercepts calculated for each row.
         :rtype: dict
         :raises ValueError: If the number of rows in dfA and dfB does not match.
         """
-        overlap = self._overlap_columns(dfA, dfB)
         n_rows = len(dfA)
         if len(dfB) != n_rows:
             raise ValueError(
@@ -255,26 +360,28 @@ class DataFrameHarmonizer:
         slopes = np.full(n_rows, np.nan, dtype=float)
         intercepts = np.full(n_rows, np.nan, dtype=float)
 
+        # extract both overlap blocks once; subsetting the frames per row would
+        # rebuild a throwaway DataFrame and Series on every iteration
+        blockA = dfA[overlap].to_numpy(dtype=float)
+        blockB = dfB[overlap].to_numpy(dtype=float)
+
+        # scratch buffers reused for every row's differences and filtered data
+        bufA = np.empty(blockA.shape[1], dtype=float)
+        bufB = np.empty(blockB.shape[1], dtype=float)
+        diff = np.empty(blockA.shape[1], dtype=float)
+
         # For each row i
         for i in range(n_rows):
-            rowA = dfA[overlap].iloc[i].values.astype(float)
-            rowB = dfB[overlap].iloc[i].values.astype(float)
-
-            # Remove NaNs
-            mask = (~np.isnan(rowA)) & (~np.isnan(rowB))
-            rowA_valid = rowA[mask]
-            rowB_valid = rowB[mask]
-            if len(rowA_valid) == 0:
-                # remain NaN
-                continue
-
-            # outlier filter => remove pairs where |A-B|>threshold
-            rowA_f, rowB_f = self._filter_outliers(rowA_valid, rowB_valid)
-            if len(rowA_f) == 0:
+            # outlier filter => keep pairs where |A-B|<=threshold; a NaN on either
+            # side never passes the comparison, so NaNs are removed too
+            k = filter_outliers_into(
+                blockA[i], blockB[i], self.outlier_threshold, bufA, bufB, scratch=diff
+            )
+            if k == 0:
                 continue  # remain NaN
 
             # Now we do a single-sensor bridging => OLS or seasonal if exactly 2 DF
-            slope_i, intercept_i = self._fit_single_pair(rowA_f, rowB_f)
+            slope_i, intercept_i = self._fit_single_pair(bufA[:k], bufB[:k])
             slopes[i] = slope_i
             intercepts[i] = intercept_i
 
@@ -317,103 +424,66 @@ class DataFrameHarmonizer:
         else:
             raise ValueError(f"Unknown method='{self.method}'")
 
-    def _filter_outliers(self, arrA, arrB):
+    def _compose_chain(self, pairwise):
         """
-        Filters outliers from the input arrays based on the specified threshold.
-
-        This method compares the absolute difference between corresponding elements
-        of two input arrays and filters out the elements that exceed the outlier
-        threshold. Only elements satisfying the condition are returned.
-
-        :param arrA: The first input NumPy array to be filtered.
-        :type arrA: numpy.ndarray
-        :param arrB: The second input NumPy array to be filtered.
-        :type arrB: numpy.ndarray
-        :return: A tuple containing two NumPy arrays with outliers removed. The first
-                 array corresponds to the filtered elements of arrA, and the second
-                 array corresponds to the filtered elements of arrB.
-        :rtype: tuple[numpy.ndarray, numpy.ndarray]
+        Composes the bridging results of one pass (ordered from the target outward)
+        into final transforms onto the target's scale. Each step follows
+        ``slope_new = a_i * slope_prev`` and ``inter_new = a_i * inter_prev + b_i``;
+        the recurrence is stepped once per adjacency (see `compose_chain`), each step
+        vectorized over the rows for the local (per-row array) approach and scalar
+        for the global approach.
+
+        :param pairwise: The ``((idxA, idxB), bridging_res)`` entries of one pass, in
+            the order they were bridged.
+        :type pairwise: list
+        :return: One transform per entry, in the same order: a ``(slope, intercept)``
+            tuple for the global approach, or a ``{"slope": array, "inter": array}``
+            dict for the local approach.
+        :rtype: list
         """
-        diffs = np.abs(arrA - arrB)
-        mask = diffs <= self.outlier_threshold
-        return arrA[mask], arrB[mask]
-
-    def _compose_into(self, idxA, idxB, bridging_res, reverse=True):
-        """
-        Composes transformation coefficients into the transformation sequence. This
-        method updates the transformation parameters for idxA based on the given
-        parameters for idxB and the bridging coefficients. It handles both global
-        and local approaches for transformations and determines whether to apply
-        the composition in reverse order.
-
-        :param idxA: Index of the transformation to be updated.
-        :type idxA: int
-        :param idxB: Index of the transformation to be used for reference.
-        :type idxB: int
-        :param bridging_res: Bridging coefficients containing "coef" (slope) and
-            "intercept" values for the transformation operation.
-        :type bridging_res: dict
-        :param reverse: Indicator for whether the composition should be applied
-            in reverse order. Defaults to True.
-        :type reverse: bool, optional
-        :return: None, the method updates the respective transformation in-place.
-        """
-        a_i = bridging_res["coef"]  # float or array
-        b_i = bridging_res["intercept"]  # float or array
-
-        # Are we in global or local approach?
+        if not pairwise:
+            return []
+        slopes, inters = compose_chain(
+            [res["coef"] for _, res in pairwise],
+            [res["intercept"] for _, res in pairwise],
+        )
         if self.approach == "global":
-            slopeB, interB = self.transforms_[idxB]  # a 2-tuple
-            if reverse:
-                new_slope = a_i * slopeB
-                new_inter = a_i * interB + b_i
-            else:
-                new_slope = slopeB * a_i
-                new_inter = a_i * interB + b_i
-            self.transforms_[idxA] = (new_slope, new_inter)
-
-        else:
-            # local => transforms_[idxB] is a dict { "slope": array, "inter": array }
-            slopeB_dict = self.transforms_[idxB]
-            slopeB_arr = slopeB_dict["slope"]
-            interB_arr = slopeB_dict["inter"]
-
-            if reverse:
-                new_slope = a_i * slopeB_arr
-                new_inter = a_i * interB_arr + b_i
-            else:
-                new_slope = slopeB_arr * a_i
-                new_inter = a_i * interB_arr + b_i
-
-            self.transforms_[idxA] = {"slope": new_slope, "inter": new_inter}
+            return [(float(s), float(i)) for s, i in zip(slopes, inters)]
+        return [{"slope": s, "inter": i} for s, i in zip(slopes, inters)]
 
     # ---------------------------
     # Internal utilities
     # ---------------------------
-    def _overlap_columns(self, dfA, dfB):
-        """
-        Identifies overlapping column names from two dataframes, excluding columns
-        specified to be skipped. The method checks for common column names between
-        the two dataframes' sets of columns, ignoring those listed in the internal
-        skip condition. If no overlap exists, an exception is raised.
-
-        :param dfA: A Pandas DataFrame to compare for overlapping column names.
-        :param dfB: Another Pandas DataFrame for comparison to identify overlapping
-                    column names.
-        :return: A sorted list of overlapping column names between `dfA` and `dfB`
-                 while excluding skipped columns.
-        :rtype: list[str]
-        :raises ValueError: If there are no overlapping column names between the
-                             two dataframes.
-        """
-        skip = self._skip_cols
-        colsA = set(dfA.columns) - skip
-        colsB = set(dfB.columns) - skip
-        overlap = sorted(colsA.intersection(colsB))
-        if not overlap:
+    def _intersect_columns(self, colsA, colsB):
+        """
+        Returns the sorted intersection of two column indexes (as returned by
+        `_data_columns`), raising if they do not overlap.
+
+        :param colsA: Data columns of the first DataFrame.
+        :type colsA: pandas.Index
+        :param colsB: Data columns of the second DataFrame.
+        :type colsB: pandas.Index
+        :return: The sorted overlapping columns.
+        :rtype: pandas.Index
+        :raises ValueError: If the two indexes have no column in common.
+        """
+        # stay on the (hashtable-backed) pandas Index instead of Python sets
+        overlap = colsA.intersection(colsB).sort_values()
+        if overlap.empty:
             raise ValueError("No overlapping date columns between adjacency pair.")
         return overlap
 
+    def _data_columns(self, df):
+        """
+        Returns the data (e.g. date) columns of a dataframe, i.e. every column except
+        the skipped coordinate columns.
+
+        :param df: A Pandas DataFrame.
+        :return: The column index of `df` without the skipped columns.
+        :rtype: pandas.Index
+        """
+        return df.columns.drop(list(self._skip_cols), errors="ignore")
+
     def _flatten_and_clean(self, dfA_sub, dfB_sub):
         """
         Flattens and cleans the input dataframes by converting them to 1D arrays and removing
@@ -426,9 +496,11 @@ class DataFrameHarmonizer:
          array corresponds to cleaned data from `dfA_sub`, and the second array corresponds
          to cleaned data from `dfB_sub`.
         """
-        arrA = dfA_sub.values.flatten()
-        arrB = dfB_sub.values.flatten()
-        mask = (~np.isnan(arrA)) & (~np.isnan(arrB))
+        arrA = dfA_sub.values.ravel()
+        arrB = dfB_sub.values.ravel()
+        # NaN != NaN => self-comparison marks the valid entries
+        mask = np.equal(arrA, arrA)
+        np.logical_and(mask, np.equal(arrB, arrB), out=mask)
         return arrA[mask], arrB[mask]
 
     def _transform_df(self, df_index, df):
@@ -473,14 +545,21 @@ class DataFrameHarmonizer:
         :param slope: The multiplier for the linear transformation.
         :param intercept: The added constant for the linear transformation.
         :return: A new pandas DataFrame with the linear transformation applied to all
-            applicable numeric columns.
+            applicable numeric columns. For the identity transform (e.g. the target
+            DataFrame) of float data, a copy of `df` is returned without arithmetic.
         :rtype: pandas.DataFrame
         """
-        new_df = df.copy()
-        numeric_cols = [c for c in df.columns if c not in self._skip_cols]
-        for col in numeric_cols:
-            new_df[col] = new_df[col] * slope + intercept
-        return new_df
+        if slope == 1.0 and intercept == 0.0 and self._has_float_data(df):
+            # x*1 + 0 => skip the arithmetic pass over the (usually largest) target
+            # frame; still a real copy, so the output never aliases the input
+            return df.copy()
+
+        # transform the whole data block at once into a fresh buffer, rather than
+        # deep-copying the frame and then overwriting its data columns
+        numeric_cols, block, out = self._extract_block(df)
+        np.multiply(block, slope, out=out)
+        np.add(out, intercept, out=out)
+        return self._rebuild_df(df, numeric_cols, out)
 
     def _apply_local_transform(self, df, slope_arr, inter_arr):
         """
@@ -502,19 +581,130 @@ class DataFrameHarmonizer:
         :param inter_arr: A 1-dimensional array of shifting factors corresponding to the
             rows of the DataFrame.
         :return: A transformed DataFrame with numeric column values scaled and shifted based
-            on the provided parameters.
+            on the provided parameters. If every row has the identity transform (and the
+            data are float), a copy of `df` is returned without arithmetic.
         :rtype: pandas.DataFrame
         :raises ValueError: If the number of rows in the DataFrame and the length of
             `slope_arr` or `inter_arr` do not match.
         """
-        new_df = df.copy()
         n_rows = len(df)
         if len(slope_arr) != n_rows:
             raise ValueError("Mismatch in row count for local transform.")
-        numeric_cols = [c for c in df.columns if c not in self._skip_cols]
-        for col in numeric_cols:
-            col_vals = new_df[col].values.astype(float)
-            # per row: new_val[r] = slope_arr[r]*old_val[r] + inter_arr[r]
-            col_vals = slope_arr * col_vals + inter_arr
-            new_df[col] = col_vals
+        if (
+            np.all(slope_arr == 1.0)
+            and np.all(inter_arr == 0.0)
+            and self._has_float_data(df)
+        ):
+            return df.copy()
+        numeric_cols, block, out = self._extract_block(df)
+        # per row: new_val[r] = slope_arr[r]*old_val[r] + inter_arr[r]
+        np.multiply(block, np.asarray(slope_arr)[:, np.newaxis], out=out)
+        np.add(out, np.asarray(inter_arr)[:, np.newaxis], out=out)
+        return self._rebuild_df(df, numeric_cols, out)
+
+    def _has_float_data(self, df):
+        """
+        Whether all data columns of `df` are NumPy floats, i.e. whether they are
+        already stored in their `_output_dtypes` and the identity transform can
+        return a plain copy.
+        """
+        numeric_cols = self._data_columns(df)
+        return all(
+            isinstance(dt, np.dtype) and dt == out
+            for dt, out in zip(
+                df.dtypes[numeric_cols], self._output_dtypes(df, numeric_cols)
+            )
+        )
+
+    def _extract_block(self, df):
+        """
+        Extracts the data columns of a DataFrame as a single 2D NumPy block (in their
+        stored dtype, see `_to_numpy`) and allocates an output buffer of the same
+        shape, wide enough for every column's output dtype (see `_output_dtypes`).
+        The `dtype` setting only applies to the bridging fits, not to the output.
+
+        :param df: The DataFrame whose data columns are to be transformed.
+        :type df: pandas.DataFrame
+        :return: A tuple ``(numeric_cols, block, out)``.
+        :rtype: tuple[pandas.Index, numpy.ndarray, numpy.ndarray]
+        """
+        numeric_cols = self._data_columns(df)
+        block = self._to_numpy(df[numeric_cols])
+        dtypes = self._output_dtypes(df, numeric_cols)
+        out_dtype = np.result_type(*dtypes) if dtypes else np.float64
+        out = np.empty(block.shape, dtype=out_dtype)
+        return numeric_cols, block, out
+
+    def _output_dtypes(self, df, numeric_cols):
+        """
+        The dtype of each data column in the harmonized frames: a floating point
+        column keeps its width (float32 stays float32, float64 stays float64, pandas
+        nullable floats become the NumPy float of the same width with NaN for missing
+        values); any other dtype (e.g. int16 scaled data) is transformed into float64.
+
+        :param df: The DataFrame to be transformed.
+        :type df: pandas.DataFrame
+        :param numeric_cols: Its data columns.
+        :type numeric_cols: pandas.Index
+        :return: One NumPy dtype per data column.
+        :rtype: list[numpy.dtype]
+        """
+        out = []
+        for dt in df.dtypes[numeric_cols]:
+            np_dt = getattr(dt, "numpy_dtype", dt)
+            is_float = isinstance(np_dt, np.dtype) and np_dt.kind == "f"
+            out.append(np_dt if is_float else np.dtype(np.float64))
+        return out
+
+    def _to_numpy(self, frame, dtype=None):
+        """
+        Converts a DataFrame of data columns to a 2D NumPy array without copying
+        plain NumPy-backed data. Pandas nullable columns (``Float64``/``Int64``, e.g.
+        after ``convert_dtypes()``) would otherwise come out as an ``object`` array
+        holding ``pd.NA``; they are converted to `dtype` (defaulting to their float
+        dtype, or float64 for non-float columns) with missing values as NaN.
+
+        :param frame: The data columns to convert.
+        :type frame: pandas.DataFrame
+        :param dtype: Target dtype; None keeps the stored NumPy dtype.
+        :type dtype: numpy dtype, optional
+        :return: The data as a 2D NumPy array.
+        :rtype: numpy.ndarray
+        """
+        dtypes = frame.dtypes
+        if all(isinstance(dt, np.dtype) for dt in dtypes):
+            return frame.to_numpy(dtype=dtype, copy=False)
+        if dtype is None:
+            np_dtypes = [getattr(dt, "numpy_dtype", dt) for dt in dtypes]
+            if np_dtypes and all(
+                isinstance(dt, np.dtype) and dt.kind == "f" for dt in np_dtypes
+            ):
+                dtype = np.result_type(*np_dtypes)
+            else:
+                dtype = np.float64
+        return frame.to_numpy(dtype=dtype, na_value=np.nan)
+
+    def _rebuild_df(self, df, numeric_cols, block):
+        """
+        Builds a new DataFrame from a transformed data block, re-attaching the skipped
+        (coordinate) columns of the original DataFrame at their original positions.
+
+        :param df: The original DataFrame.
+        :type df: pandas.DataFrame
+        :param numeric_cols: The data columns that `block` holds, in order.
+        :type numeric_cols: pandas.Index
+        :param block: The transformed values, shaped ``(len(df), len(numeric_cols))``.
+        :type block: numpy.ndarray
+        :return: A new DataFrame with the same columns and index as `df`, its data
+            columns in their `_output_dtypes`.
+        :rtype: pandas.DataFrame
+        """
+        new_df = pd.DataFrame(block, index=df.index, columns=numeric_cols)
+        dtypes = self._output_dtypes(df, numeric_cols)
+        if any(dt != block.dtype for dt in dtypes):
+            # mixed-width data was transformed at the widest width; narrow it back
+            new_df = new_df.astype(dict(zip(numeric_cols, dtypes)))
+        for pos, col in enumerate(df.columns):
+            if col in self._skip_cols:
+                new_df.insert(pos, col, df[col])
         return new_df
@@ -18,7 +18,11 @@ in a two-pass manner.
 1. Instantiate a `Harmonizer` with a chosen method (e.g. 'linear').
 2. Call `fit()` on a list of sensor data arrays, optionally specifying outlier thresholds
    and time indexes (for seasonal mode).
-3. Transform new data by calling `transform(sensor_index, x, t=...)`.
+3. Transform new data by calling `transform(sensor_index, x, t=...)`, or
+   `transform_all(X)` to map a ``(n_sensors, ...)`` stack in one go (linear only).
+
+For raster stacks, `fit_many(sensor_stack)` fits an independent linear chain for
+every pixel of a ``(n_sensors, n_pixels, n_time)`` array in one vectorized pass.
 
 **Example**::
     from pixltsnorm.harmonize import Harmonizer
@@ -30,13 +34,15 @@ in a two-pass manner.
     new_value_harmonized = harm.transform(sensor_index=0, x=some_value)
 
 This module relies on separate utility and model functions:
-- **`utils.filter_outliers`** for threshold-based outlier removal,
-- **`models.fit_linear`** and **`models.fit_seasonal`** for different calibration approaches.
+- **`utils.outlier_mask`** for threshold-based outlier removal,
+- **`models.fit_seasonal`** for the seasonal calibration approach (the linear approach
+  fuses outlier filtering and the regression into one streaming pass).
 """
 
 import numpy as np
-from .utils import filter_outliers
-from .models import fit_linear, fit_seasonal
+from ._kernels import compose_chain, linear_from_stats, sufficient_stats
+from .utils import outlier_mask
+from .models import fit_seasonal
 
 
 class Harmonizer:
@@ -73,7 +79,9 @@ class Harmonizer:
     :type seasonal_map_b_: Optional
     """
 
-    def __init__(self, method="linear", period=None, outlier_threshold=0.2):
+    def __init__(
+        self, method="linear", period=None, outlier_threshold=0.2, n_jobs=None
+    ):
         """
         Class for managing data transformations and outlier detections with configurable
         parameters and optional seasonal alignment. It supports initialization of core
@@ -83,6 +91,7 @@ class Harmonizer:
             - method (str): The method used for interpolation. Default is 'linear'.
             - period (Optional): The seasonal period when applicable.
             - default_outlier_threshold (float): The default threshold for outlier detection.
+            - n_jobs (Optional): Threads used by the linear regression kernels.
             - outlier_thresholds_ (Optional): Placeholder for outlier thresholds after fitting or transforming data.
             - transforms_ (Optional): Placeholder for transformation details.
             - target_index_ (Optional): Index of the target data.
@@ -97,10 +106,15 @@ class Harmonizer:
         :type period: Optional
         :param outlier_threshold: Threshold value for detecting outliers. Defaults to 0.2.
         :type outlier_threshold: float
+        :param n_jobs: Number of threads used to accumulate the linear regression sums
+            (the time axis is split between them). None or 1 runs serially, -1 uses
+            all CPUs. Defaults to None.
+        :type n_jobs: Optional[int]
         """
         self.method = method
         self.period = period
         self.default_outlier_threshold = outlier_threshold
+        self.n_jobs = n_jobs
 
         self.outlier_thresholds_ = None
         self.transforms_ = None
@@ -108,22 +122,70 @@ class Harmonizer:
         self.pairwise_left_ = []
         self.pairwise_right_ = []
 
-        # For 2-sensor seasonal approach
-        self.seasonal_map_a_ = None
-        self.seasonal_map_b_ = None
+        # transforms_ as contiguous per-sensor slope/intercept arrays
+        self._slopes_ = None
+        self._intercepts_ = None
+
+        # For 2-sensor seasonal approach: seasonal components aligned with the
+        # sorted, unique inlier times (seasonal_map_a_/_b_ are built from these)
+        self._seasonal_t_ = None
+        self._seas_a_ = None
+        self._seas_b_ = None
+
+    @property
+    def seasonal_map_a_(self):
+        """
+        Seasonal component of sensor A per inlier time, as a ``{time: value}`` dict
+        (two-sensor seasonal approach only, otherwise None). Built on access from
+        the array storage used by `transform`.
+        """
+        if self._seasonal_t_ is None:
+            return None
+        return dict(zip(self._seasonal_t_, self._seas_a_))
+
+    @property
+    def seasonal_map_b_(self):
+        """
+        Seasonal component of sensor B per inlier time, as a ``{time: value}`` dict
+        (two-sensor seasonal approach only, otherwise None).
+        """
+        if self._seasonal_t_ is None:
+            return None
+        return dict(zip(self._seasonal_t_, self._seas_b_))
+
+    def _seasonal_lookup(self, t):
+        """
+        Looks up the fitted seasonal components of sensors A and B at times `t` by
+        binary search in the sorted inlier times; times not seen during the fit get
+        0.0.
+
+        :param t: Times to look up.
+        :type t: array-like
+        :return: ``(seasonal_a, seasonal_b)`` arrays, same length as `t`.
+        :rtype: tuple[np.ndarray, np.ndarray]
+        """
+        t_arr = np.array(t, ndmin=1)
+        if self._seasonal_t_.dtype.kind == "M":
+            # e.g. Timestamps (object array) against stored datetime64 values
+            t_arr = t_arr.astype(self._seasonal_t_.dtype)
+
+        idx = np.searchsorted(self._seasonal_t_, t_arr)
+        idx = np.minimum(idx, len(self._seasonal_t_) - 1)
+        found = self._seasonal_t_[idx] == t_arr
+        seasA = np.where(found, self._seas_a_[idx], 0.0)
+        seasB = np.where(found, self._seas_b_[idx], 0.0)
+        return seasA, seasB
 
     def _harmonize_two_sensors(
         self, sensor_a_vals, sensor_b_vals, outlier_thresh, time_index=None
     ):
         """
-        Harmonizes two sets of sensor data by applying either a linear alignment or
-        seasonal decomposition, based on the selected method. The function filters
-        outliers in the input data and computes alignment parameters accordingly.
+        Harmonizes two sets of sensor data by seasonal decomposition. The function
+        filters outliers in the input data and computes alignment parameters
+        accordingly, aligning the data seasonally using a given time index and period.
 
-        This method supports different calibration strategies. For 'linear', a simple
-        linear fit is applied to the filtered sensor data. If 'seasonal_decompose' is
-        selected, the data is further aligned seasonally, using a given time index
-        and period to compute decomposition results.
+        The 'linear' method never comes through here: `_fit_adjacencies` fits all
+        linear adjacencies at once with the fused outlier-filter/regression kernel.
 
         :param sensor_a_vals: Values captured by the first sensor.
         :type sensor_a_vals: list or numpy.ndarray
@@ -139,49 +201,141 @@ class Harmonizer:
             calibration strategy.
         :rtype: tuple
         """
-        # 1) filter outliers
-        a_filt, b_filt = filter_outliers(
-            sensor_a_vals, sensor_b_vals, threshold=outlier_thresh
-        )
-
-        if self.method == "linear":
-            # simple linear
-            linres = fit_linear(a_filt, b_filt)
-            return linres["coef"], linres["intercept"]
-
-        elif self.method == "seasonal_decompose":
+        if self.method == "seasonal_decompose":
             # only valid if we have exactly 2 sensors & user gave time_index, period
             if time_index is None or self.period is None:
                 raise ValueError(
                     "time_index and period required for seasonal_decompose."
                 )
 
-            # We must also filter out outliers in time sync. If you want to keep the same mask:
-            # you can forcibly keep the same indices as a_filt,b_filt => you'd have to track them.
-            # Or do your own approach. For brevity, we'll just do the same approach:
-            # We'll pass a_filt,b_filt + time_index_inliers to fit_seasonal
-            # by figuring out which original indices are in the 'a_filt,b_filt'.
-
-            # We'll do a quick approach: we already have a_filt,b_filt. We must find which
-            # indexes they correspond to in the original arrays. We'll assume the difference approach:
-            arrA = np.array(sensor_a_vals)
-            arrB = np.array(sensor_b_vals)
-            mask = np.abs(arrB - arrA) <= outlier_thresh
-
-            # subset time_index
-            time_idx_inliers = np.array(time_index)[mask]
+            # filter outliers; the same mask subsets the time index so it stays
+            # in sync with the filtered values
+            arrA = np.asarray(sensor_a_vals)
+            arrB = np.asarray(sensor_b_vals)
+            mask = outlier_mask(arrA, arrB, threshold=outlier_thresh)
+            a_filt, b_filt = arrA[mask], arrB[mask]
+            time_idx_inliers = np.asarray(time_index)[mask]
 
             # Now do seasonal fit
             seasres = fit_seasonal(a_filt, b_filt, time_idx_inliers, self.period)
 
-            self.seasonal_map_a_ = dict(zip(time_idx_inliers, seasres["seasonal_x"]))
-            self.seasonal_map_b_ = dict(zip(time_idx_inliers, seasres["seasonal_y"]))
+            # sort by time (stable) and keep the last entry per repeated time
+            order = np.argsort(time_idx_inliers, kind="stable")
+            t_sorted = time_idx_inliers[order]
+            last = np.append(t_sorted[1:] != t_sorted[:-1], True)
+            self._seasonal_t_ = t_sorted[last]
+            self._seas_a_ = np.asarray(seasres["seasonal_x"], dtype=float)[order][last]
+            self._seas_b_ = np.asarray(seasres["seasonal_y"], dtype=float)[order][last]
 
             return seasres["coef"], seasres["intercept"]
 
         else:
             raise ValueError(f"Unknown method='{self.method}'.")
 
+    def _fit_adjacencies(self, sensor_list, outlier_thresholds, time_indexes):
+        """
+        Fits every adjacent sensor pair ``(k, k+1)`` of the chain.
+
+        For the 'linear' method, all sensors are stacked into one 2D array and the
+        regression sums of every adjacency are accumulated in a single streaming
+        pass (outliers and NaNs excluded on the fly), after which all slopes and
+        intercepts are solved at once. Other methods fit each pair through
+        `_harmonize_two_sensors`.
+
+        :param sensor_list: Sensor data arrays, all of the same shape.
+        :type sensor_list: list
+        :param outlier_thresholds: One outlier threshold per adjacency.
+        :type outlier_thresholds: list[float]
+        :param time_indexes: Time index arrays as accepted by `fit`.
+        :type time_indexes: list[array-like] or array-like or None
+        :return: A list of ``(coef, intercept)`` tuples, where entry ``k`` maps
+            sensor ``k`` onto sensor ``k+1``.
+        :rtype: list[tuple]
+        :raises ValueError: If an adjacency has no data left after outlier filtering.
+        """
+        n = len(sensor_list)
+
+        if self.method == "linear":
+            # pool any array shape (e.g. (pixels, time) blocks) into one row per
+            # sensor, as the regression does for the pairwise fit
+            stack = np.stack([np.asarray(s).ravel() for s in sensor_list])
+            stats = sufficient_stats(
+                stack[:-1],
+                stack[1:],
+                np.asarray(outlier_thresholds, dtype=float),
+                n_jobs=self.n_jobs,
+            )
+            empty = np.flatnonzero(stats[0] == 0)
+            if empty.size:
+                k = empty[0]
+                raise ValueError(
+                    f"No data left after outlier filtering for sensors ({k}, {k + 1})."
+                )
+            slopes, intercepts = linear_from_stats(*stats)
+            return list(zip(slopes.tolist(), intercepts.tolist()))
+
+        # resolve time_indexes once: a list of length n => one time index per
+        # sensor, a single array => shared by all. We'll do minimal checks
+        if isinstance(time_indexes, (list, np.ndarray)):
+            if len(time_indexes) == n:
+                t_per_sensor = time_indexes
+            else:
+                t_per_sensor = [time_indexes] * n
+        else:
+            t_per_sensor = [None] * n
+
+        return [
+            self._harmonize_two_sensors(
+                sensor_list[k],
+                sensor_list[k + 1],
+                outlier_thresh=outlier_thresholds[k],
+                time_index=t_per_sensor[k],
+            )
+            for k in range(n - 1)
+        ]
+
+    def _start_chain(self, n, target_index, outlier_thresholds):
+        """
+        Validates the chain configuration shared by `fit` and `fit_many` and resets
+        the fitted state.
+
+        :param n: Number of sensors in the chain.
+        :type n: int
+        :param target_index: Requested target sensor, or None for the last one.
+        :type target_index: int or None
+        :param outlier_thresholds: One threshold per adjacency, or None for the
+            default threshold everywhere.
+        :type outlier_thresholds: list[float] or None
+        :return: The resolved ``(target_index, outlier_thresholds)``.
+        :rtype: tuple
+        :raises ValueError: If there are fewer than 2 sensors, if target_index is out
+            of range, or if outlier_thresholds has the wrong length.
+        """
+        if n < 2:
+            raise ValueError("Need >=2 sensors to chain harmonize.")
+        if target_index is None:
+            target_index = n - 1
+        if not (0 <= target_index < n):
+            raise ValueError(f"target_index {target_index} out of range.")
+
+        self.target_index_ = target_index
+
+        # handle outlier_thresholds
+        if outlier_thresholds is None:
+            outlier_thresholds = [self.default_outlier_threshold] * (n - 1)
+        else:
+            if len(outlier_thresholds) != n - 1:
+                raise ValueError("wrong length for outlier_thresholds")
+
+        self.outlier_thresholds_ = outlier_thresholds
+
+        self.pairwise_left_.clear()
+        self.pairwise_right_.clear()
+        self._seasonal_t_ = None
+        self._seas_a_ = None
+        self._seas_b_ = None
+        return target_index, outlier_thresholds
+
     def fit(
         self, sensor_list, target_index=None, outlier_thresholds=None, time_indexes=None
     ):
@@ -221,95 +375,111 @@ class Harmonizer:
             than 2 sensors, as this is not yet supported.
         """
         n = len(sensor_list)
-        if n < 2:
-            raise ValueError("Need >=2 sensors to chain harmonize.")
-        if target_index is None:
-            target_index = n - 1
-        if not (0 <= target_index < n):
-            raise ValueError(f"target_index {target_index} out of range.")
-
         if self.method == "seasonal_decompose" and n > 2:
             raise NotImplementedError(
                 "multi-sensor + seasonal_decompose not supported."
             )
-
-        self.target_index_ = target_index
-
-        # handle outlier_thresholds
-        if outlier_thresholds is None:
-            outlier_thresholds = [self.default_outlier_threshold] * (n - 1)
-        else:
-            if len(outlier_thresholds) != n - 1:
-                raise ValueError("wrong length for outlier_thresholds")
-
-        self.outlier_thresholds_ = outlier_thresholds
+        target_index, outlier_thresholds = self._start_chain(
+            n, target_index, outlier_thresholds
+        )
 
         # init transforms => slope/intercept for each sensor->target
         transforms = [None] * n
         transforms[target_index] = (1.0, 0.0)
 
-        self.pairwise_left_.clear()
-        self.pairwise_right_.clear()
-        self.seasonal_map_a_ = None
-        self.seasonal_map_b_ = None
+        # every adjacency (k, k+1) is used by exactly one of the passes
+        pair_fits = self._fit_adjacencies(sensor_list, outlier_thresholds, time_indexes)
 
         # left pass
         for i in range(target_index, 0, -1):
-            out_thresh = outlier_thresholds[i - 1]
-            if time_indexes is None:
-                t_idx_a = None
-            else:
-                # if time_indexes is a list of length n => pass time_indexes[i-1]
-                # or if single array => pass it. We'll do minimal checks
-                if isinstance(time_indexes, (list, np.ndarray)):
-                    if len(time_indexes) == n:
-                        t_idx_a = time_indexes[i - 1]
-                    else:
-                        t_idx_a = time_indexes
-                else:
-                    t_idx_a = None
-
-            coef, intercept = self._harmonize_two_sensors(
-                sensor_list[i - 1],
-                sensor_list[i],
-                outlier_thresh=out_thresh,
-                time_index=t_idx_a,
-            )
-            self.pairwise_left_.append(((i - 1, i), (coef, intercept)))
-
-            slope_i, inter_i = transforms[i]
-            slope_new = coef * slope_i
-            inter_new = coef * inter_i + intercept
-            transforms[i - 1] = (slope_new, inter_new)
+            self.pairwise_left_.append(((i - 1, i), pair_fits[i - 1]))
 
         # right pass
         for i in range(target_index, n - 1):
-            out_thresh = outlier_thresholds[i]
-            if time_indexes is None:
-                t_idx_a = None
-            else:
-                if isinstance(time_indexes, (list, np.ndarray)):
-                    if len(time_indexes) == n:
-                        t_idx_a = time_indexes[i]
-                    else:
-                        t_idx_a = time_indexes
-                else:
-                    t_idx_a = None
-
-            coef, intercept = self._harmonize_two_sensors(
-                sensor_list[i],
-                sensor_list[i + 1],
-                outlier_thresh=out_thresh,
-                time_index=t_idx_a,
-            )
-            self.pairwise_right_.append(((i, i + 1), (coef, intercept)))
+            self.pairwise_right_.append(((i, i + 1), pair_fits[i]))
 
-            slope_i, inter_i = transforms[i]
-            slope_new = slope_i * coef
-            inter_new = coef * inter_i + intercept
-            transforms[i + 1] = (slope_new, inter_new)
+        # compose each side outward from the target, one step per adjacency:
+        # slope_new = coef * slope_prev, inter_new = coef * inter_prev + intercept
+        for pairwise, end in ((self.pairwise_left_, 0), (self.pairwise_right_, 1)):
+            slopes, inters = compose_chain(
+                [res[0] for _, res in pairwise], [res[1] for _, res in pairwise]
+            )
+            for (pair, _), slope, inter in zip(pairwise, slopes, inters):
+                transforms[pair[end]] = (float(slope), float(inter))
 
         self.transforms_ = transforms
+        self._slopes_ = np.array([tr[0] for tr in transforms], dtype=np.float64)
+        self._intercepts_ = np.array([tr[1] for tr in transforms], dtype=np.float64)
+        return self
+
+    def fit_many(self, sensor_stack, target_index=None, outlier_thresholds=None):
+        """
+        Fits one linear harmonization chain per pixel, for all pixels at once.
+
+        Equivalent to calling `fit` separately on ``sensor_stack[:, p, :]`` for every
+        pixel ``p``, but the regression sums of every adjacency and every pixel are
+        accumulated in a single vectorized pass along the time axis, and the chains
+        are composed for all pixels together. Afterwards ``transforms_`` holds one
+        ``(slopes, intercepts)`` pair of per-pixel arrays per sensor, and `transform`
+        / `transform_all` apply the per-pixel coefficients.
+
+        :param sensor_stack: Sensor data shaped ``(n_sensors, n_pixels, n_time)``.
+        :type sensor_stack: array-like
+        :param target_index: Index of the target (reference) sensor. Defaults to the
+            last sensor.
+        :type target_index: int, optional
+        :param outlier_thresholds: One outlier threshold per adjacency, as in `fit`.
+        :type outlier_thresholds: list[float], optional
+        :return: The fitted instance.
+        :rtype: self
+        :raises NotImplementedError: If the method is not 'linear'.
+        :raises ValueError: If `sensor_stack` is not 3D, or for the same invalid
+            configurations as `fit`.
+
+        .. note::
+            Pixels where an adjacency keeps no pair after outlier filtering get NaN
+            coefficients instead of raising, so one empty pixel does not abort a
+            whole scene.
+        """
+        if self.method != "linear":
+            raise NotImplementedError("fit_many only supports method='linear'.")
+
+        stack = np.asarray(sensor_stack)
+        if stack.ndim != 3:
+            raise ValueError(
+                "sensor_stack must have shape (n_sensors, n_pixels, n_time)"
+            )
+        n = stack.shape[0]
+        target_index, outlier_thresholds = self._start_chain(
+            n, target_index, outlier_thresholds
+        )
+
+        # per (adjacency, pixel) sums in one pass => (n - 1, n_pixels) coefficients
+        thresholds = np.asarray(outlier_thresholds, dtype=float)[:, np.newaxis]
+        coefs, intercepts = linear_from_stats(
+            *sufficient_stats(stack[:-1], stack[1:], thresholds, n_jobs=self.n_jobs)
+        )
+
+        slopes = np.ones((n, stack.shape[1]))
+        inters = np.zeros((n, stack.shape[1]))
+        # left side outward from the target: adjacencies target-1, ..., 0
+        left = np.arange(target_index)[::-1]
+        slopes[left], inters[left] = compose_chain(coefs[left], intercepts[left])
+        # right side outward from the target: adjacencies target, ..., n-2
+        right = slice(target_index, n - 1)
+        shifted = slice(target_index + 1, n)
+        slopes[shifted], inters[shifted] = compose_chain(
+            coefs[right], intercepts[right]
+        )
+
+        for i in range(target_index, 0, -1):
+            self.pairwise_left_.append(((i - 1, i), (coefs[i - 1], intercepts[i - 1])))
+        for i in range(target_index, n - 1):
+            self.pairwise_right_.append(((i, i + 1), (coefs[i], intercepts[i])))
+
+        self.transforms_ = list(zip(slopes, inters))
+        self._slopes_ = slopes
+        self._intercepts_ = inters
         return self
 
     def transform(self, sensor_index, x, t=None):
@@ -325,7 +495,8 @@ class Harmonizer:
         :param sensor_index: Index of the sensor for which the transformation should
             be applied.
         :type sensor_index: int
-        :param x: Input data value(s) to be transformed. Can be a scalar or an array.
+        :param x: Input data value(s) to be transformed. Can be a scalar or an array;
+            after `fit_many`, an array shaped ``(n_pixels, ...)``.
         :type x: Union[float, Sequence[float]]
         :param t: (Optional) Temporal index associated with the input data. Required
             when using the 'seasonal_decompose' method. Can be a scalar or an array.
@@ -342,11 +513,22 @@ class Harmonizer:
         if self.transforms_ is None:
             raise RuntimeError("must call fit first")
 
-        slope, intercept = self.transforms_[sensor_index]
+        slope = self._slopes_[sensor_index]
+        intercept = self._intercepts_[sensor_index]
 
         if self.method == "linear":
-            # normal
-            return slope * np.array(x) + intercept
+            # normal; float32 input stays float32 (no upcast of raster-sized arrays)
+            x_arr = np.array(x)
+            if x_arr.dtype == np.float32:
+                slope, intercept = slope.astype(np.float32), intercept.astype(
+                    np.float32
+                )
+            if np.ndim(slope):
+                # per-pixel coefficients (fit_many) => broadcast over trailing axes
+                extra = (1,) * (x_arr.ndim - slope.ndim)
+                slope = slope.reshape(slope.shape + extra)
+                intercept = intercept.reshape(intercept.shape + extra)
+            return slope * x_arr + intercept
 
         elif self.method == "seasonal_decompose":
             # only valid if n=2
@@ -355,24 +537,58 @@ class Harmonizer:
 
             # if sensor_index== target => pass x back
             # else => x-> deseason => slope*(x-seasA)+ intercept + seasB
-            out = []
             x_arr = np.array(x, ndmin=1)  # handle scalar or array
-            # handle t similarly
-            t_arr = np.array(t, ndmin=1)
-
-            for xi, ti in zip(x_arr, t_arr):
-                if sensor_index == self.target_index_:
-                    out.append(xi)
-                else:
-                    seasA = self.seasonal_map_a_.get(ti, 0.0)
-                    seasB = self.seasonal_map_b_.get(ti, 0.0)
-                    x_des = xi - seasA
-                    y_hat = slope * x_des + intercept + seasB
-                    out.append(y_hat)
+
+            if sensor_index == self.target_index_:
+                out = x_arr
+            else:
+                # look up all times at once (unseen => 0.0)
+                seasA, seasB = self._seasonal_lookup(t)
+                out = slope * (x_arr - seasA) + intercept + seasB
 
             if len(x_arr) == 1:  # single value
                 return out[0]
-            return np.array(out)
+            return out
 
         else:
             raise ValueError(f"unknown method {self.method}")
+
+    def transform_all(self, X):
+        """
+        Transform the data of all sensors at once using the pre-fitted linear model.
+
+        Row ``i`` of `X` holds data from sensor ``i``; every row is mapped onto the
+        target sensor's scale in a single broadcast operation,
+        ``slopes[:, None] * X + intercepts[:, None]``, instead of one `transform` call
+        per sensor.
+
+        :param X: Data to transform, shaped ``(n_sensors, ...)`` (e.g.
+            ``(n_sensors, n_pixels)``); after `fit_many`, shaped
+            ``(n_sensors, n_pixels, ...)``.
+        :type X: array-like
+        :return: The transformed data, same shape as `X`.
+        :rtype: np.ndarray
+        :raises RuntimeError: If the model has not been fitted before calling this
+            method.
+        :raises NotImplementedError: If the method is not 'linear'.
+        :raises ValueError: If the first dimension of `X` does not match the number
+            of fitted sensors.
+        """
+        if self.transforms_ is None:
+            raise RuntimeError("must call fit first")
+        if self.method != "linear":
+            raise NotImplementedError("transform_all only supports method='linear'.")
+
+        X = np.asarray(X)
+        n = len(self._slopes_)
+        if X.ndim == 0 or X.shape[0] != n:
+            raise ValueError(f"X must have shape (n_sensors={n}, ...)")
+
+        slopes, intercepts = self._slopes_, self._intercepts_
+        if X.dtype == np.float32:
+            slopes, intercepts = slopes.astype(np.float32), intercepts.astype(
+                np.float32
+            )
+
+        shape = slopes.shape + (1,) * (X.ndim - slopes.ndim)
+        return slopes.reshape(shape) * X + intercepts.reshape(shape)
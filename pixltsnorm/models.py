@@ -8,12 +8,22 @@ time-series calibration:
 
 1. **`fit_linear(...)`**
    - Applies a basic linear model: :math:`y = coef \cdot x + intercept`
-   - Uses scikit-learn's :class:`LinearRegression` to fit slope and intercept.
+   - Fits slope and intercept with the closed-form ordinary least squares solution
+     (no model object or input validation overhead for this univariate case).
    - Returns a dictionary with ``{'coef': float, 'intercept': float}``.
 
-2. **`fit_seasonal(...)`**
-   - Decomposes both ``x_values`` and ``y_values`` using statsmodels'
-     :func:`seasonal_decompose` to extract seasonal components.
+2. **`fit_linear_filtered(...)`**
+   - Same linear model, fitted only on the pairs with :math:`|x - y| \leq threshold`
+     (NaNs are ignored too), directly on 1D or 2D NumPy arrays.
+   - Streams the regression sums instead of materializing filtered copies, which
+     makes it suitable for scene-wide blocks of already aligned data.
+   - Returns a dictionary with ``{'coef': float, 'intercept': float}``.
+
+3. **`fit_seasonal(...)`**
+   - Decomposes both ``x_values`` and ``y_values`` with a classical additive
+     decomposition (equivalent to statsmodels' :func:`seasonal_decompose` with
+     ``extrapolate_trend="freq"``, implemented directly in NumPy) to extract
+     seasonal components.
    - Regresses the residual (deseasonalized) y on the residual (deseasonalized) x.
    - Returns the fitted slope/intercept plus the extracted seasonal patterns.
 
@@ -29,21 +39,96 @@ These functions are invoked primarily by classes like
 wherever you need either a simple linear or a seasonal decomposition–based calibration.
 """
 
+import hashlib
+import threading
+from collections import OrderedDict
+
 import numpy as np
-from sklearn.linear_model import LinearRegression
-from statsmodels.tsa.seasonal import seasonal_decompose
+from ._kernels import additive_seasonal, fit_filtered
 
 
 def fit_linear(x_values, y_values):
     """
     Fit a simple linear regression: y ~ coef*x + intercept
     Returns a dict { 'coef': float, 'intercept': float }
+    A constant x gives coef=0 and intercept=mean(y).
+    Raises ValueError on empty input or if x or y contains NaN or infinity.
+    """
+    x = np.asarray(x_values, dtype=np.float64).ravel()
+    y = np.asarray(y_values, dtype=np.float64).ravel()
+    if x.size == 0:
+        raise ValueError("fit_linear requires at least one data point.")
+    if not (np.isfinite(x).all() and np.isfinite(y).all()):
+        raise ValueError("fit_linear input contains NaN or infinity.")
+
+    # closed-form OLS on centered data: coef = cov(x, y) / var(x)
+    x_mean = x.mean()
+    y_mean = y.mean()
+    dx = x - x_mean
+    # rounding can leave a tiny nonzero dx for constant x, so detect it directly
+    if np.all(x == x[0]):
+        coef = 0.0
+    else:
+        coef = float(dx @ (y - y_mean) / (dx @ dx))
+    intercept = float(y_mean - coef * x_mean)
+    return {"coef": coef, "intercept": intercept}
+
+
+def fit_linear_filtered(x_values, y_values, outlier_threshold=0.2, n_jobs=None):
+    """
+    Fit y ~ coef*x + intercept on the pairs where abs(x - y) <= outlier_threshold.
+    Pairs with a NaN on either side are ignored. x_values and y_values may be 1D or
+    2D arrays of the same shape (e.g. aligned pixel x date blocks); all elements are
+    pooled into one fit. n_jobs > 1 (or -1 for all CPUs) accumulates the sums in
+    that many threads.
+    Returns a dict { 'coef': float, 'intercept': float }
+    Raises ValueError if no pair is left after filtering.
     """
-    x = np.array(x_values).reshape(-1, 1)
-    y = np.array(y_values).reshape(-1, 1)
+    coef, intercept, n_kept = fit_filtered(
+        x_values, y_values, outlier_threshold, n_jobs=n_jobs
+    )
+    if n_kept == 0:
+        raise ValueError("No valid data after removing NaNs and outliers.")
+    return {"coef": coef, "intercept": intercept}
+
 
-    reg = LinearRegression().fit(x, y)
-    return {"coef": reg.coef_[0][0], "intercept": reg.intercept_[0]}
+# LRU cache of seasonal components, keyed by a digest of the series (so keys stay
+# small) and bounded by the total size of the cached arrays
+_SEASONAL_CACHE = OrderedDict()
+_SEASONAL_CACHE_MAXBYTES = 64 * 2**20
+_SEASONAL_CACHE_LOCK = threading.Lock()
+_seasonal_cache_nbytes = 0
+
+
+def _seasonal_component(values, period):
+    """
+    Additive seasonal component of `values`, memoized per (series, period), since
+    batch fits often decompose the same series (e.g. repeated or no-data pixels)
+    many times. The returned array is read-only because it is shared.
+    """
+    global _seasonal_cache_nbytes
+
+    arr = np.ascontiguousarray(values, dtype=np.float64)
+    key = (hashlib.blake2b(memoryview(arr), digest_size=16).digest(), arr.size, period)
+    with _SEASONAL_CACHE_LOCK:
+        seasonal = _SEASONAL_CACHE.get(key)
+        if seasonal is not None:
+            _SEASONAL_CACHE.move_to_end(key)
+            return seasonal
+
+    seasonal = additive_seasonal(arr, period)
+    seasonal.flags.writeable = False
+    if seasonal.nbytes > _SEASONAL_CACHE_MAXBYTES:
+        return seasonal
+
+    with _SEASONAL_CACHE_LOCK:
+        if key not in _SEASONAL_CACHE:
+            _SEASONAL_CACHE[key] = seasonal
+            _seasonal_cache_nbytes += seasonal.nbytes
+        while _seasonal_cache_nbytes > _SEASONAL_CACHE_MAXBYTES:
+            _, evicted = _SEASONAL_CACHE.popitem(last=False)
+            _seasonal_cache_nbytes -= evicted.nbytes
+    return seasonal
 
 
 def fit_seasonal(x_values, y_values, time_index, period):
@@ -54,20 +139,15 @@ def fit_seasonal(x_values, y_values, time_index, period):
       3) Return { 'coef':..., 'intercept':..., 'seasonal_x':..., 'seasonal_y':... }
 
     You can store or return any additional info as needed.
+    The decompositions are memoized per (series, period), so refitting identical
+    series is cheap; the returned seasonal arrays are the caller's own copies.
     """
     # Decompose
     x_arr = np.array(x_values)
     y_arr = np.array(y_values)
 
-    dec_x = seasonal_decompose(
-        x_arr, period=period, model="additive", extrapolate_trend="freq"
-    )
-    dec_y = seasonal_decompose(
-        y_arr, period=period, model="additive", extrapolate_trend="freq"
-    )
-
-    seas_x = dec_x.seasonal
-    seas_y = dec_y.seasonal
+    seas_x = _seasonal_component(x_arr, period)
+    seas_y = _seasonal_component(y_arr, period)
 
     x_deseason = x_arr - seas_x
     y_deseason = y_arr - seas_y
@@ -78,6 +158,6 @@ def fit_seasonal(x_values, y_values, time_index, period):
     return {
         "coef": linres["coef"],
         "intercept": linres["intercept"],
-        "seasonal_x": seas_x,
-        "seasonal_y": seas_y,
+        "seasonal_x": seas_x.copy(),
+        "seasonal_y": seas_y.copy(),
     }
@@ -21,14 +21,25 @@ to help unify sensor data, filter noisy measurements, and align time axes.
    - Useful for constructing consistent time series across multiple DataFrames
      that might have different sets of date columns.
 
-2. **`filter_outliers(sensor_a_values, sensor_b_values, threshold=0.2)`**
+2. **`filter_outliers(sensor_a_values, sensor_b_values, threshold=0.2, scratch=None)`**
    - Applies threshold-based outlier filtering on two numeric arrays, removing
      pairs where :math:`|A - B| > threshold`.
    - Returns the filtered arrays (A, B), containing only the points that
      satisfy :math:`|A - B| \leq threshold`.
+   - An optional ``scratch`` buffer holds the differences, so repeated calls
+     (e.g. one per pixel) do not allocate a temporary each time.
    - Often used prior to fitting a linear model or seasonal decomposition,
      ensuring large mismatches don’t skew the calibration.
 
+3. **`filter_outliers_into(sensor_a_values, sensor_b_values, threshold, out_a, out_b, scratch=None)`**
+   - Same filter, but compacts the kept pairs into caller-provided buffers and
+     returns how many were kept, so repeated calls (e.g. one per pixel) can reuse
+     the same two buffers instead of allocating new arrays each time.
+
+4. **`outlier_mask(sensor_a_values, sensor_b_values, threshold=0.2, scratch=None)`**
+   - The boolean keep-mask used by both filters above, for subsetting other
+     aligned arrays (such as time indexes) consistently with the filtered data.
+
 **Example**::
 
     from pixltsnorm.utils import unify_and_extract_timeseries, filter_outliers
@@ -46,7 +57,6 @@ outlier handling.
 """
 
 import numpy as np
-import pandas as pd
 
 
 def unify_and_extract_timeseries(
@@ -56,8 +66,8 @@ def unify_and_extract_timeseries(
     Unify the date columns across multiple DataFrames by:
       1) Identifying columns not in `skip_cols`.
       2) Taking the union of those columns from all DataFrames.
-      3) Reindexing each DataFrame to that union (missing => NaN).
-      4) Extracting row_index's time series from each DataFrame.
+      3) Extracting row_index's time series from each DataFrame.
+      4) Reindexing each extracted row to that union (missing => NaN).
       5) Returning the union columns (converted to datetime) and a time_axis.
 
     Args:
@@ -76,22 +86,25 @@ def unify_and_extract_timeseries(
         df_l5, df_l7, df_l8 = ...
         arrays, dates, time_axis = unify_and_extract_timeseries([df_l5, df_l7, df_l8])
     """
-    columns_list = []
-    for df in dfs:
-        valid_cols = [c for c in df.columns if c not in skip_cols]
-        columns_list.append(valid_cols)
-
-    union_cols = sorted(set().union(*columns_list))
-
-    reindexed_dfs = []
-    for df in dfs:
-        reindexed_df = df.reindex(columns=union_cols + list(skip_cols))
-        reindexed_dfs.append(reindexed_df)
-
+    # pandas is only needed here; importing it lazily keeps the array-only code
+    # paths (Harmonizer, the filters) free of the pandas import cost
+    import pandas as pd
+
+    # hash-based union of the column labels (Index.union only sorts when the
+    # indexes differ, so sort explicitly to keep the result order deterministic)
+    union_cols = dfs[0].columns.drop(list(skip_cols), errors="ignore")
+    for df in dfs[1:]:
+        union_cols = union_cols.union(
+            df.columns.drop(list(skip_cols), errors="ignore"), sort=False
+        )
+    union_cols = union_cols.unique().sort_values()
+
+    # take the single row first, then align it: reindexing a 1D row costs
+    # O(len(union_cols)) instead of materializing an (nrows, ncols_union) frame
     list_of_arrays = []
-    for rdf in reindexed_dfs:
-        arr = rdf.iloc[row_index, : -len(skip_cols)].values
-        list_of_arrays.append(arr)
+    for df in dfs:
+        row = df.iloc[row_index, ~df.columns.isin(skip_cols)]
+        list_of_arrays.append(row.reindex(union_cols).to_numpy())
 
     dates = pd.to_datetime(union_cols, format=date_format, errors="coerce")
     time_axis = np.arange(len(dates))
@@ -99,7 +112,44 @@ def unify_and_extract_timeseries(
     return list_of_arrays, dates, time_axis
 
 
-def filter_outliers(sensor_a_values, sensor_b_values, threshold=0.2):
+def _abs_diff(a, b, scratch=None):
+    """
+    abs(a - b), computed in place in a single array (`scratch` if given).
+    """
+    if scratch is None:
+        diff = np.subtract(a, b)
+    else:
+        if len(scratch) < a.size:
+            raise ValueError("scratch buffer is smaller than the input arrays")
+        diff = np.subtract(a, b, out=scratch[: a.size].reshape(a.shape))
+    return np.abs(diff, out=diff)
+
+
+def outlier_mask(sensor_a_values, sensor_b_values, threshold=0.2, scratch=None):
+    """
+    Boolean mask of the pairs kept by the outlier filter, abs(sensor_a - sensor_b)
+    <= threshold. Pairs with a NaN on either side are never kept.
+
+    This is the single implementation behind `filter_outliers` and
+    `filter_outliers_into`; use it directly to subset further aligned arrays
+    (e.g. a time index) with the same mask.
+
+    Args:
+        sensor_a_values (array-like): data array for sensor A
+        sensor_b_values (array-like): data array for sensor B
+        threshold (float): difference threshold
+        scratch (np.ndarray, optional): 1D float buffer, at least as long as the
+            input, used for the differences so repeated calls allocate no temporary
+
+    Returns:
+        np.ndarray: boolean mask, same shape as the inputs
+    """
+    a = np.asarray(sensor_a_values)
+    b = np.asarray(sensor_b_values)
+    return _abs_diff(a, b, scratch) <= threshold
+
+
+def filter_outliers(sensor_a_values, sensor_b_values, threshold=0.2, scratch=None):
     """
     Remove pairs where abs(sensor_a - sensor_b) > threshold.
 
@@ -107,13 +157,51 @@ def filter_outliers(sensor_a_values, sensor_b_values, threshold=0.2):
         sensor_a_values (array-like): data array for sensor A
         sensor_b_values (array-like): data array for sensor B
         threshold (float): difference threshold
+        scratch (np.ndarray, optional): 1D float buffer, at least as long as the
+            input, used for the differences so repeated calls allocate no temporary
 
     Returns:
         tuple of arrays: (filtered_a, filtered_b)
     """
-    a = np.array(sensor_a_values)
-    b = np.array(sensor_b_values)
+    a = np.asarray(sensor_a_values)
+    b = np.asarray(sensor_b_values)
 
-    diff = np.abs(a - b)
-    mask = diff <= threshold
+    mask = outlier_mask(a, b, threshold, scratch)
     return a[mask], b[mask]
+
+
+def filter_outliers_into(
+    sensor_a_values, sensor_b_values, threshold, out_a, out_b, scratch=None
+):
+    """
+    Remove pairs where abs(sensor_a - sensor_b) > threshold, writing the kept
+    pairs into preallocated buffers instead of returning new arrays.
+    Pairs with a NaN on either side are removed as well.
+
+    Args:
+        sensor_a_values (array-like): data array for sensor A
+        sensor_b_values (array-like): data array for sensor B
+        threshold (float): difference threshold
+        out_a (np.ndarray): buffer receiving the kept values of A (at least as
+            long as the input)
+        out_b (np.ndarray): buffer receiving the kept values of B
+        scratch (np.ndarray, optional): 1D float buffer, at least as long as the
+            input, used for the differences (see `filter_outliers`)
+
+    Returns:
+        int: number of kept pairs k; the filtered data are out_a[:k], out_b[:k]
+    """
+    a = np.asarray(sensor_a_values)
+    b = np.asarray(sensor_b_values)
+    if len(out_a) < a.size or len(out_b) < b.size:
+        raise ValueError("output buffers are smaller than the input arrays")
+
+    idx = np.flatnonzero(outlier_mask(a, b, threshold, scratch))
+    k = idx.size
+    for src, out in ((a, out_a), (b, out_b)):
+        if out.dtype == src.dtype:
+            # gather straight into the buffer, no temporary
+            np.take(src, idx, out=out[:k])
+        else:
+            out[:k] = src[idx]
+    return k
@@ -1,6 +1,8 @@
 import pytest
+import numpy as np
 import pandas as pd
 from pixltsnorm.dataframe_harmonize import DataFrameHarmonizer
+from pixltsnorm.harmonize import Harmonizer
 
 
 def test_dataframe_harmonizer_global():
@@ -77,3 +79,165 @@ def test_dataframe_harmonizer_transform_dfs():
     # Let's check row[0, col 't1'] => original 0.0 => mapped => 2.0*0.0 + 0.05 => 0.05
     # We can confirm from the output DF
     assert pytest.approx(dfA_h["t1"][0], 0.01) == 0.05
+
+
+@pytest.mark.parametrize("approach", ["global", "local"])
+@pytest.mark.parametrize(
+    "dtypes, expected",
+    [
+        ((np.float64, np.float64), (np.float64, np.float64)),
+        ((np.float32, np.float32), (np.float32, np.float32)),
+        ((np.float32, np.float64), (np.float32, np.float64)),
+        (("Float64", "Float32"), (np.float64, np.float32)),
+    ],
+)
+def test_dataframe_harmonizer_output_dtype(approach, dtypes, expected):
+    """
+    Harmonized frames keep each column's float width, target included.
+    """
+    dfA = pd.DataFrame({"t1": [0.1, 0.2, 0.3], "t2": [0.3, 0.4, 0.6]})
+    dfB = dfA * 1.1 + 0.02
+    dfA, dfB = (df.astype(dict(zip(df.columns, dtypes))) for df in (dfA, dfB))
+
+    harm_df = DataFrameHarmonizer(method="linear", approach=approach)
+    harm_df.fit([dfA, dfB], target_index=1)
+    for out in harm_df.get_harmonized_dfs([dfA, dfB]):
+        assert list(out.dtypes) == [np.dtype(dt) for dt in expected]
+
+
+@pytest.mark.parametrize(
+    "approach, dtype",
+    [("global", np.float32), ("global", None), ("local", np.float32)],
+)
+def test_dataframe_harmonizer_nullable_columns(approach, dtype):
+    """
+    Pandas nullable (Float64/Int64) columns with missing values harmonize like the
+    equivalent NumPy float frames.
+    """
+    dfs = _chain_frames(2)
+    dfs[0].iloc[1, 2] = np.nan
+    nullable = [df.convert_dtypes() for df in dfs]
+    assert nullable[0]["lon"].dtype == "Float64"
+
+    harm_df = DataFrameHarmonizer(method="linear", approach=approach, dtype=dtype)
+    harm_df.fit(nullable, target_index=1)
+    ref = DataFrameHarmonizer(method="linear", approach=approach, dtype=dtype)
+    ref.fit(dfs, target_index=1)
+
+    for out, expected in zip(
+        harm_df.get_harmonized_dfs(nullable), ref.get_harmonized_dfs(dfs)
+    ):
+        assert list(out.columns) == list(expected.columns)
+        np.testing.assert_allclose(
+            out.to_numpy(dtype=float, na_value=np.nan),
+            expected.to_numpy(dtype=float),
+        )
+
+
+def test_dataframe_harmonizer_target_is_copied():
+    """
+    The harmonized target frame must not share data with the input frame.
+    """
+    dfA = pd.DataFrame({"t1": [0.1, 0.2, 0.3], "t2": [0.3, 0.4, 0.6]})
+    dfB = dfA * 1.1 + 0.02
+    harm_df = DataFrameHarmonizer(method="linear", approach="global")
+    harm_df.fit([dfA, dfB], target_index=1)
+
+    target = harm_df.get_harmonized_dfs([dfA, dfB])[1]
+    target.iloc[0, 0] = 99.0
+    assert dfB.iloc[0, 0] != 99.0
+    assert not np.shares_memory(target["t1"].to_numpy(), dfB["t1"].to_numpy())
+
+
+def _chain_frames(n_frames, n_rows=6, n_cols=8, seed=0):
+    # chain of frames with lon/lat mixed in between the date columns
+    rng = np.random.default_rng(seed)
+    base = rng.uniform(0.1, 0.8, (n_rows, n_cols))
+    dfs = []
+    for k in range(n_frames):
+        data = (1.0 + 0.1 * k) * base + 0.01 * k + rng.normal(0, 0.005, base.shape)
+        df = pd.DataFrame(data, columns=[f"2000-{m + 1:02d}" for m in range(n_cols)])
+        df.insert(0, "lon", np.linspace(-95, -94, n_rows))
+        df.insert(3, "lat", np.linspace(36, 37, n_rows))
+        dfs.append(df)
+    return dfs
+
+
+def test_dataframe_harmonizer_global_chain():
+    """
+    Global bridging of more than 2 frames should match the array Harmonizer fed with
+    the pooled data of each frame.
+    """
+    dfs = _chain_frames(4)
+    harm_df = DataFrameHarmonizer(method="linear", approach="global", dtype=None)
+    harm_df.fit(dfs, target_index=2)
+
+    arrays = [df.drop(columns=["lon", "lat"]).to_numpy().ravel() for df in dfs]
+    ref = Harmonizer(method="linear", outlier_threshold=0.2).fit(arrays, 2)
+    assert np.allclose(harm_df.transforms_, ref.transforms_)
+
+
+def test_dataframe_harmonizer_local_chain():
+    """
+    Local bridging of more than 2 frames should match a per-row array chain.
+    """
+    dfs = _chain_frames(3)
+    harm_df = DataFrameHarmonizer(method="linear", approach="local")
+    harm_df.fit(dfs, target_index=1)
+
+    for r in range(len(dfs[0])):
+        rows = [df.drop(columns=["lon", "lat"]).to_numpy()[r] for df in dfs]
+        ref = Harmonizer(method="linear", outlier_threshold=0.2).fit(rows, 1)
+        for k in range(3):
+            assert np.isclose(harm_df.transforms_[k]["slope"][r], ref.transforms_[k][0])
+            assert np.isclose(harm_df.transforms_[k]["inter"][r], ref.transforms_[k][1])
+
+
+def test_dataframe_harmonizer_keeps_column_layout():
+    """
+    Harmonized frames keep lon/lat (unchanged) at their original positions.
+    """
+    dfs = _chain_frames(2)
+    harm_df = DataFrameHarmonizer(method="linear", approach="global")
+    harm_df.fit(dfs, target_index=1)
+    for df, out in zip(dfs, harm_df.get_harmonized_dfs(dfs)):
+        assert list(out.columns) == list(df.columns)
+        pd.testing.assert_frame_equal(out[["lon", "lat"]], df[["lon", "lat"]])
+
+
+def test_dataframe_harmonizer_int16_scaled():
+    """
+    dtype=None bridges int16 scaled data directly (threshold in scaled units).
+    """
+    dfs = _chain_frames(2)
+    scaled = []
+    for df in dfs:
+        df = df.copy()
+        cols = df.columns.drop(["lon", "lat"])
+        df[cols] = (df[cols] * 10000).round().astype(np.int16)
+        scaled.append(df)
+
+    harm_df = DataFrameHarmonizer(
+        method="linear", approach="global", dtype=None, outlier_threshold=2000
+    )
+    harm_df.fit(scaled, target_index=1)
+    ref = DataFrameHarmonizer(method="linear", approach="global", dtype=None)
+    ref.fit(dfs, target_index=1)
+
+    slope, intercept = harm_df.transforms_[0]
+    assert pytest.approx(slope, 1e-3) == ref.transforms_[0][0]
+    assert pytest.approx(intercept / 10000, abs=1e-3) == ref.transforms_[0][1]
+    out = harm_df.get_harmonized_dfs(scaled)[0]
+    assert out["2000-01"].dtype == np.float64
+
+
+def test_dataframe_harmonizer_no_overlap():
+    """
+    A chain with a pair of frames sharing no date column is rejected up front.
+    """
+    dfA = pd.DataFrame({"2000-01": [0.1, 0.2], "lon": [0.0, 1.0]})
+    dfB = pd.DataFrame({"2000-01": [0.1, 0.2], "2000-02": [0.3, 0.4]})
+    dfC = pd.DataFrame({"2001-01": [0.1, 0.2]})
+    harm_df = DataFrameHarmonizer(method="linear", approach="global")
+    with pytest.raises(ValueError, match="No overlapping"):
+        harm_df.fit([dfA, dfB, dfC])
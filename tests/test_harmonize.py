@@ -1,5 +1,6 @@
 import pytest
 import numpy as np
+import pandas as pd
 from pixltsnorm.harmonize import Harmonizer
 
 
@@ -48,3 +49,164 @@ def test_harmonizer_transform():
     mapped_val = harm.transform(sensor_index=0, x=0.2)
     # expected = 2.0*0.2 + 0.05 = 0.45
     assert pytest.approx(mapped_val, 0.01) == 0.45
+
+
+def test_harmonizer_seasonal_transform_vectorized():
+    """
+    Array transform in seasonal mode should match element-wise transforms,
+    and times not seen during fit should get no seasonal adjustment.
+    """
+    np.random.seed(0)
+    t = np.arange(48)
+    data_a = 0.5 + 0.2 * np.sin(2 * np.pi * t / 12) + np.random.normal(0, 0.01, 48)
+    data_b = 1.1 * data_a + 0.05 + np.random.normal(0, 0.01, 48)
+
+    harm = Harmonizer(method="seasonal_decompose", period=12, outlier_threshold=0.5)
+    harm.fit([data_a, data_b], target_index=1, time_indexes=t)
+
+    x = data_a[:6]
+    t_new = np.array([0, 1, 2, 3, 4, 999])
+    out = harm.transform(sensor_index=0, x=x, t=t_new)
+    expected = [harm.transform(0, xi, ti) for xi, ti in zip(x, t_new)]
+    assert np.allclose(out, expected)
+
+    slope, intercept = harm.transforms_[0]
+    assert pytest.approx(out[-1]) == slope * x[-1] + intercept
+    # target sensor is passed through
+    assert np.allclose(harm.transform(1, x, t_new), x)
+
+
+def test_harmonizer_transform_all():
+    """
+    transform_all() should match per-sensor transform() calls.
+    """
+    np.random.seed(1)
+    base = np.random.uniform(0, 1, 50)
+    sensors = [base, 1.2 * base + 0.01, 0.9 * (1.2 * base + 0.01) - 0.02]
+
+    harm = Harmonizer(method="linear", outlier_threshold=1.0)
+    harm.fit(sensors, target_index=1)
+
+    X = np.random.uniform(0, 1, (3, 7))
+    out = harm.transform_all(X)
+    assert out.shape == X.shape
+    for i in range(3):
+        assert np.allclose(out[i], harm.transform(sensor_index=i, x=X[i]))
+
+    with pytest.raises(ValueError):
+        harm.transform_all(X[:2])
+
+
+def test_harmonizer_float32_inputs():
+    """
+    float32 sensors should fit like float64 ones and transform to float32.
+    """
+    np.random.seed(2)
+    base = np.random.uniform(0, 1, 200)
+    sensors = [base, 1.1 * base - 0.05]
+
+    harm64 = Harmonizer(method="linear", outlier_threshold=1.0).fit(sensors, 1)
+    harm32 = Harmonizer(method="linear", outlier_threshold=1.0).fit(
+        [s.astype(np.float32) for s in sensors], 1
+    )
+    assert np.allclose(harm32.transforms_, harm64.transforms_, atol=1e-5)
+
+    x = base[:10].astype(np.float32)
+    assert harm32.transform(0, x).dtype == np.float32
+    assert harm32.transform_all(np.stack([x, x])).dtype == np.float32
+
+
+def test_harmonizer_linear_2d_sensors():
+    """
+    2D sensor blocks (e.g. pixels x time) are pooled into a single regression.
+    """
+    np.random.seed(3)
+    a = np.random.uniform(0, 1, (5, 12))
+    sensors = [a, 1.1 * a + 0.01, 1.2 * a - 0.02]
+
+    harm = Harmonizer(method="linear", outlier_threshold=1.0).fit(sensors, 2)
+    ref = Harmonizer(method="linear", outlier_threshold=1.0).fit(
+        [s.ravel() for s in sensors], 2
+    )
+    assert np.allclose(harm.transforms_, ref.transforms_)
+
+    slope, intercept = Harmonizer().fit([a, 1.1 * a + 0.01]).transforms_[0]
+    assert pytest.approx(slope) == 1.1
+    assert pytest.approx(intercept, abs=1e-9) == 0.01
+
+
+def test_harmonizer_fit_many():
+    """
+    fit_many() should match per-pixel fit() calls.
+    """
+    np.random.seed(3)
+    n_pixels, n_time = 4, 30
+    base = np.random.uniform(0, 1, (n_pixels, n_time))
+    gains = np.random.uniform(0.8, 1.2, (3, n_pixels, 1))
+    stack = gains * base + np.random.normal(0, 0.01, (3, n_pixels, n_time))
+
+    harm = Harmonizer(method="linear", outlier_threshold=1.0)
+    harm.fit_many(stack, target_index=1)
+
+    X = np.random.uniform(0, 1, (3, n_pixels, 5))
+    out = harm.transform_all(X)
+    for p in range(n_pixels):
+        ref = Harmonizer(method="linear", outlier_threshold=1.0)
+        ref.fit(list(stack[:, p]), target_index=1)
+        for i in range(3):
+            assert np.allclose(harm.transforms_[i][0][p], ref.transforms_[i][0])
+            assert np.allclose(harm.transforms_[i][1][p], ref.transforms_[i][1])
+            assert np.allclose(out[i, p], ref.transform(i, X[i, p]))
+    assert np.allclose(harm.transform(0, X[0]), out[0])
+
+
+def test_harmonizer_seasonal_maps():
+    """
+    seasonal_map_a_/_b_ should still expose the fitted seasonal components per
+    time, also for datetime time indexes.
+    """
+    np.random.seed(5)
+    t = pd.date_range("2000-01-01", periods=48, freq="MS")
+    base = 0.5 + 0.2 * np.sin(2 * np.pi * np.arange(48) / 12)
+    sensorA = base + np.random.normal(0, 0.01, 48)
+    sensorB = 1.1 * base + 0.02 + np.random.normal(0, 0.01, 48)
+
+    harm = Harmonizer(method="seasonal_decompose", period=12, outlier_threshold=0.5)
+    harm.fit([sensorA, sensorB], target_index=1, time_indexes=t.values)
+
+    assert len(harm.seasonal_map_a_) == 48
+    ts = t[5].to_datetime64()
+    seasA, seasB = harm.seasonal_map_a_[ts], harm.seasonal_map_b_[ts]
+    slope, intercept = harm.transforms_[0]
+    expected = slope * (sensorA[5] - seasA) + intercept + seasB
+    assert np.isclose(harm.transform(0, sensorA[5], t[5]), expected)
+
+
+def test_harmonizer_import_does_not_load_pandas():
+    """
+    The array-only API should be importable without pulling in pandas.
+    """
+    import subprocess
+    import sys
+
+    code = (
+        "import sys; from pixltsnorm import Harmonizer; "
+        "sys.exit('pandas' in sys.modules)"
+    )
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
+
+
+def test_package_submodule_access():
+    """
+    Submodules should stay reachable as attributes of the package.
+    """
+    import subprocess
+    import sys
+
+    code = (
+        "import pixltsnorm; "
+        "pixltsnorm.models.fit_linear; pixltsnorm.harmonize.Harmonizer; "
+        "pixltsnorm.utils.filter_outliers; "
+        "pixltsnorm.dataframe_harmonize.DataFrameHarmonizer"
+    )
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
@@ -0,0 +1,174 @@
+import warnings
+import pytest
+import numpy as np
+from pixltsnorm._kernels import (
+    sufficient_stats,
+    pooled_stats,
+    linear_from_stats,
+    compose_chain,
+    additive_seasonal,
+)
+
+
+def test_sufficient_stats_matches_polyfit():
+    np.random.seed(0)
+    a = np.random.uniform(0, 1, 1000)
+    b = 1.3 * a + 0.1 + np.random.normal(0, 0.01, 1000)
+    b[::50] += 1.0  # outliers
+    a[::77] = np.nan
+
+    # small chunks to exercise the streaming accumulation
+    stats = sufficient_stats(a, b, 0.2, chunk_size=64)
+    slope, intercept = linear_from_stats(*stats)
+
+    keep = np.abs(a - b) <= 0.2
+    assert stats[0] == keep.sum()
+    exp_slope, exp_intercept = np.polyfit(a[keep], b[keep], 1)
+    assert pytest.approx(slope, 1e-9) == exp_slope
+    assert pytest.approx(intercept, 1e-9) == exp_intercept
+
+
+def test_sufficient_stats_per_row():
+    a = np.array([[0.0, 1.0, 2.0], [0.0, 1.0, 2.0]])
+    b = np.array([[1.0, 3.0, 5.0], [0.0, 0.5, 1.0]])
+    slope, intercept = linear_from_stats(*sufficient_stats(a, b, 10.0))
+    assert np.allclose(slope, [2.0, 0.5])
+    assert np.allclose(intercept, [1.0, 0.0])
+
+
+def test_linear_from_stats_degenerate():
+    # no kept pairs => NaN, constant x => slope 0 and mean(y)
+    slope, intercept = linear_from_stats(*sufficient_stats([0.1], [5.0], 0.2))
+    assert np.isnan(slope) and np.isnan(intercept)
+    slope, intercept = linear_from_stats(*sufficient_stats([0.5, 0.5], [0.4, 0.6], 0.2))
+    assert slope == 0.0
+    assert pytest.approx(intercept) == 0.5
+    # constants that are not exact in binary must not leave a spurious slope
+    for value, n in ((0.1, 7), (0.1, 10), (0.3, 10)):
+        y = np.linspace(0.0, 0.2, n) + value
+        slope, intercept = linear_from_stats(*sufficient_stats(np.full(n, value), y, 1))
+        assert slope == 0.0
+        assert pytest.approx(intercept) == y.mean()
+
+
+@pytest.mark.parametrize("n_jobs", [None, 3])
+def test_sufficient_stats_large_offset(n_jobs):
+    # well-conditioned data far from zero must not cancel to a zero variance
+    rng = np.random.default_rng(8)
+    a = 1e4 + rng.normal(0, 0.01, 1000)
+    b = 2 * a + 1 + rng.normal(0, 1e-4, 1000)
+    a[::97] = np.nan
+
+    slope, intercept = linear_from_stats(
+        *sufficient_stats(a, b, np.inf, chunk_size=64, n_jobs=n_jobs)
+    )
+    keep = ~np.isnan(a)
+    exp_slope, exp_intercept = np.polyfit(a[keep] - 1e4, b[keep], 1)
+    assert pytest.approx(slope, 1e-6) == exp_slope
+    assert pytest.approx(intercept, 1e-6) == exp_intercept - exp_slope * 1e4
+
+    # a constant with an offset still gives slope 0 and mean(b)
+    slope, intercept = linear_from_stats(
+        *pooled_stats(np.full((4, 30), 1e4 + 0.1), b[:120].reshape(4, 30), np.inf)
+    )
+    assert slope == 0.0
+    assert pytest.approx(intercept) == np.nanmean(b[:120])
+
+
+def test_compose_chain_matches_loop():
+    np.random.seed(3)
+    a = np.random.uniform(0.5, 1.5, 5)
+    b = np.random.uniform(-0.1, 0.1, 5)
+    slopes, inters = compose_chain(a, b)
+
+    slope, inter = 1.0, 0.0
+    for k in range(5):
+        slope, inter = a[k] * slope, a[k] * inter + b[k]
+        assert pytest.approx(slopes[k]) == slope
+        assert pytest.approx(inters[k]) == inter
+
+
+@pytest.mark.parametrize("period", [2, 3, 12])
+def test_additive_seasonal_matches_statsmodels(period):
+    seasonal = pytest.importorskip("statsmodels.tsa.seasonal")
+    rng = np.random.default_rng(period)
+    for nobs in (2 * period, 3 * period + 1, 60):
+        t = np.arange(nobs)
+        x = np.sin(2 * np.pi * t / period) + 0.01 * t + rng.normal(0, 0.1, nobs)
+        with warnings.catch_warnings():
+            # extrapolate_trend="freq" is deprecated in recent statsmodels
+            warnings.simplefilter("ignore", FutureWarning)
+            ref = seasonal.seasonal_decompose(
+                x, period=period, model="additive", extrapolate_trend="freq"
+            ).seasonal
+        assert np.allclose(additive_seasonal(x, period), ref)
+
+
+@pytest.mark.parametrize(
+    "period, nobs, expected",
+    [
+        # per-phase values from statsmodels' seasonal_decompose(model="additive",
+        # extrapolate_trend="freq") on the same series
+        (4, 10, [-0.014479166667, 0.992604166667, 0.0171875, -0.9953125]),
+        (3, 7, [-0.014197530864, 0.88145750255, -0.867259971686]),
+        (2, 4, [-0.0025, 0.0025]),
+    ],
+)
+def test_additive_seasonal_reference_values(period, nobs, expected):
+    t = np.arange(nobs)
+    x = np.sin(2 * np.pi * t / period) + 0.05 * t + ((t * 7) % 5) / 50
+    seasonal = additive_seasonal(x, period)
+    assert np.allclose(seasonal, np.tile(expected, nobs)[:nobs], atol=1e-10)
+
+
+def test_additive_seasonal_errors():
+    with pytest.raises(ValueError):
+        additive_seasonal(np.arange(5.0), 3)
+    with pytest.raises(ValueError):
+        additive_seasonal([1.0, np.nan, 2.0, 3.0], 2)
+
+
+def test_sufficient_stats_threaded():
+    rng = np.random.default_rng(4)
+    a = rng.uniform(0, 1, (3, 1000))
+    b = 1.1 * a + rng.normal(0, 0.05, a.shape)
+    b[0, ::7] = np.nan
+    serial = sufficient_stats(a, b, 0.2, chunk_size=300)
+    threaded = sufficient_stats(a, b, 0.2, chunk_size=300, n_jobs=3)
+    for s, t in zip(serial, threaded):
+        assert np.allclose(s, t)
+    assert np.array_equal(serial[0], threaded[0])
+
+
+def test_compose_chain_per_pixel():
+    rng = np.random.default_rng(6)
+    a = rng.uniform(0.5, 1.5, (4, 10))
+    b = rng.uniform(-0.1, 0.1, (4, 10))
+    a[2, 3] = 0.0
+    a[1, 5] = np.nan
+    slopes, inters = compose_chain(a, b)
+    for p in range(10):
+        ref_s, ref_i = compose_chain(a[:, p], b[:, p])
+        assert np.allclose(slopes[:, p], ref_s, equal_nan=True)
+        assert np.allclose(inters[:, p], ref_i, equal_nan=True)
+    assert compose_chain(np.empty((0, 3)), np.empty((0, 3)))[0].shape == (0, 3)
+
+
+def test_pooled_stats_memory_layouts():
+    rng = np.random.default_rng(7)
+    a = rng.uniform(0, 1, (50, 8))
+    b = 0.9 * a + rng.normal(0, 0.05, a.shape)
+    a[3, 2] = np.nan
+    keep = np.abs(a - b) <= 0.1
+    expected = (keep.sum(), a[keep].sum(), b[keep].sum())
+
+    # C/C, F/F (as from DataFrame.to_numpy) and mixed layouts pair identically
+    for x, y in (
+        (a, b),
+        (np.asfortranarray(a), np.asfortranarray(b)),
+        (a, np.asfortranarray(b)),
+    ):
+        n, sa, sb, _, _, ra, rb = pooled_stats(x, y, 0.1, chunk_size=64)
+        assert n == expected[0]
+        # the sums are taken about the reference values (ra, rb)
+        assert np.allclose((sa + n * ra, sb + n * rb), expected[1:])
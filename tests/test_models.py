@@ -1,6 +1,6 @@
 import pytest
 import numpy as np
-from pixltsnorm.models import fit_linear, fit_seasonal
+from pixltsnorm.models import fit_linear, fit_linear_filtered, fit_seasonal
 
 
 def test_fit_linear():
@@ -12,6 +12,20 @@ def test_fit_linear():
     assert pytest.approx(res["intercept"], 0.05) == 0.3
 
 
+def test_fit_linear_filtered():
+    # 2D block (e.g. pixels x dates) with a NaN and an outlier
+    x = np.linspace(0, 1, 20).reshape(4, 5)
+    y = 2.0 * x + 0.3
+    x[0, 0] = np.nan
+    y[3, 4] += 5.0
+    res = fit_linear_filtered(x, y, outlier_threshold=1.5)
+    assert pytest.approx(res["coef"]) == 2.0
+    assert pytest.approx(res["intercept"]) == 0.3
+
+    with pytest.raises(ValueError):
+        fit_linear_filtered(x, y + 10.0, outlier_threshold=1.5)
+
+
 def test_fit_seasonal_basic():
     """
     Basic check for fit_seasonal. We'll skip the real decomposition
@@ -28,3 +42,44 @@ def test_fit_seasonal_basic():
     assert all(k in out for k in ["coef", "intercept", "seasonal_x", "seasonal_y"])
     # Because real decomposition + regression is domain-specific,
     # we won't check exact numeric output for a toy example.
+
+
+def test_fit_seasonal_cached():
+    """
+    Refitting the same series should reuse the memoized decomposition, while the
+    returned seasonal arrays stay independent, writable copies.
+    """
+    from pixltsnorm import models
+
+    t = np.arange(48)
+    xvals = 0.5 + 0.2 * np.sin(2 * np.pi * t / 12) + 0.001 * t
+    yvals = 1.2 * xvals + 0.05
+
+    first = fit_seasonal(xvals, yvals, t, 12)
+    n_cached = len(models._SEASONAL_CACHE)
+    first["seasonal_x"] += 1.0  # callers may modify the result in place
+
+    second = fit_seasonal(xvals.copy(), yvals.copy(), t, 12)
+    assert len(models._SEASONAL_CACHE) == n_cached
+    assert np.allclose(second["seasonal_x"], first["seasonal_x"] - 1.0)
+    assert second["seasonal_x"].flags.writeable
+    assert second["coef"] == first["coef"]
+
+
+def test_fit_linear_degenerate_inputs():
+    # constant x that is not exactly representable => no spurious slope
+    res = fit_linear([0.1] * 7, np.linspace(0.2, 0.4, 7))
+    assert res["coef"] == 0.0
+    assert pytest.approx(res["intercept"]) == 0.3
+
+    with pytest.raises(ValueError):
+        fit_linear([0.1, np.nan, 0.3], [0.2, 0.4, 0.6])
+
+
+@pytest.mark.parametrize("offset, step", [(1e6, 1.0), (2451545.0, 1e-3)])
+def test_fit_linear_large_offset(offset, step):
+    # x with a large offset relative to its spread (e.g. Julian dates)
+    x = offset + step * np.arange(5.0)
+    res = fit_linear(x, 0.5 * (x - offset) + 0.1)
+    assert pytest.approx(res["coef"], 1e-6) == 0.5
+    assert pytest.approx(res["intercept"], 1e-6) == 0.1 - 0.5 * offset
@@ -1,7 +1,12 @@
 import pytest
 import pandas as pd
 import numpy as np
-from pixltsnorm.utils import unify_and_extract_timeseries, filter_outliers
+from pixltsnorm.utils import (
+    unify_and_extract_timeseries,
+    filter_outliers,
+    filter_outliers_into,
+    outlier_mask,
+)
 
 
 def test_filter_outliers():
@@ -13,6 +18,27 @@ def test_filter_outliers():
     # We expect first 3 pairs remain
     assert len(fa) == 3
     assert len(fb) == 3
+    assert outlier_mask(a, b, threshold=0.2).tolist() == [True, True, True, False]
+
+
+def test_filter_outliers_into():
+    a = np.array([0.1, 0.2, np.nan, 0.6, 0.9])
+    b = np.array([0.12, 0.22, 0.3, 0.55, 1.2])
+    out_a = np.empty(5)
+    out_b = np.empty(5)
+    # NaN pair and the last pair (diff 0.3) are removed
+    k = filter_outliers_into(a, b, 0.2, out_a, out_b)
+    assert k == 3
+    assert np.allclose(out_a[:k], [0.1, 0.2, 0.6])
+    assert np.allclose(out_b[:k], [0.12, 0.22, 0.55])
+
+    # same result when the differences go through a caller-provided buffer
+    scratch = np.empty(5)
+    assert filter_outliers_into(a, b, 0.2, out_a, out_b, scratch=scratch) == 3
+    fa, fb = filter_outliers(a, b, threshold=0.2, scratch=scratch)
+    assert np.allclose(fa, [0.1, 0.2, 0.6])
+    with pytest.raises(ValueError):
+        filter_outliers(a, b, threshold=0.2, scratch=np.empty(2))
 
 
 def test_unify_extract_timeseries():